@@ -0,0 +1,11 @@
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from hypergrid.dsl import *  # noqa: F403
+
+
+def __getattr__(name: str) -> Any:
+    # The DSL is also reachable from the package (e.g. `hypergrid.profile()`), imported only on first use
+    from hypergrid.dsl import _load
+
+    return _load(name, globals())
@@ -0,0 +1,206 @@
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict, namedtuple
+from functools import update_wrapper
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Optional, TypeVar
+
+from hypergrid.util import dependencies
+
+if TYPE_CHECKING:
+    from hypergrid.grid import Grid
+
+T = TypeVar("T")
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+_MISSING = object()
+
+# Set by `set_cache_dir`, overriding the HYPERGRID_CACHE_DIR environment variable
+_cache_dir: Optional[Path] = None
+
+
+class LRU:
+    """
+    A bounded least-recently-used mapping with hit/miss statistics.  `maxsize=None` never evicts.
+    """
+
+    def __init__(self, maxsize: Optional[int] = 128) -> None:
+        assert maxsize is None or maxsize > 0, "LRU maxsize must be positive"
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"LRU(maxsize={self.maxsize})"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Look up `key`, returning `_MISSING` (and counting a miss) if it isn't cached.  Unhashable keys count as a miss
+          before raising TypeError.
+        """
+        with self._lock:
+            try:
+                value = self._entries.get(key, _MISSING)
+            except TypeError:
+                self.misses += 1
+                raise
+            if value is _MISSING:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if self.maxsize is not None and len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __getstate__(self) -> dict:
+        # Locks can't be pickled, and cached values (e.g. models) shouldn't be shipped to other processes
+        return {"maxsize": self.maxsize}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["maxsize"])  # type: ignore[misc]
+
+
+class Memoized:
+    """
+    Wraps a grid function (for `map`, `map_to`, `filter`, ...) so that its results are cached per input grid element.
+
+    Elements are keyed by their field names and values, so the same function can be shared between grids.  Elements with
+      unhashable values bypass the cache and are counted as misses.
+    """
+
+    def __init__(self, func: Callable[[Any], Any], cache: Optional[LRU] = None) -> None:
+        self.func = func
+        self.cache = cache if cache is not None else LRU()
+        update_wrapper(self, func)
+        fields = dependencies(func)
+        if fields is not None:
+            self.__hypergrid_depends_on__ = fields
+
+    def __repr__(self) -> str:
+        return f"Memoized({self.func!r}, {self.cache!r})"
+
+    def __call__(self, ge: tuple) -> Any:
+        key = (getattr(ge, "_fields", None), ge)
+        try:
+            value = self.cache.get(key)
+        except TypeError:
+            return self.func(ge)
+        if value is _MISSING:
+            value = self.func(ge)
+            self.cache.put(key, value)
+        return value
+
+    def cache_info(self) -> CacheInfo:
+        return self.cache.cache_info()
+
+    def cache_clear(self) -> None:
+        self.cache.cache_clear()
+
+
+def memoize(func: Callable[[Any], Any], maxsize: Optional[int] = 128) -> Memoized:
+    """
+    e.g. `grid.map_to(model=memoize(build_model, maxsize=1024))`, or `memoize(instantiate_lambda(Model))` to cache instantiation.
+    """
+    return Memoized(func, LRU(maxsize))
+
+
+class DiskCache:
+    """
+    A directory of pickled values keyed by strings (e.g. grid fingerprints), shared between processes and runs.
+
+    Writes go to a temporary file that is atomically renamed into place, so concurrent writers and readers never see a
+      partial entry.  Entries that can't be read (or values that can't be pickled) are treated as misses.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+
+    def __repr__(self) -> str:
+        return f"DiskCache({str(self.directory)!r})"
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.pkl"
+
+    def get(self, key: str) -> Any:
+        """
+        Look up `key`, returning `_MISSING` if it isn't cached.
+        """
+        try:
+            with open(self._path(key), "rb") as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return _MISSING
+
+    def put(self, key: str, value: Any) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp, path)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            os.remove(temp)
+
+    def clear(self) -> None:
+        for path in self.directory.glob("*/*.pkl"):
+            path.unlink(missing_ok=True)
+
+
+def set_cache_dir(directory: Optional[str | Path]) -> None:
+    """
+    Cache expensive derived grid results (filtered lengths and contents) on disk under `directory`, keyed by each grid's
+      structural fingerprint, so re-declaring the same grid in a later run or another process reuses them.  `None`
+      falls back to the HYPERGRID_CACHE_DIR environment variable; with neither set, nothing is cached on disk.
+    """
+    global _cache_dir
+    _cache_dir = None if directory is None else Path(directory)
+
+
+def disk_cache() -> Optional[DiskCache]:
+    directory = _cache_dir or os.environ.get("HYPERGRID_CACHE_DIR")
+    return None if not directory else DiskCache(directory)
+
+
+def _disk_cached(grid: "Grid", kind: str, compute: Callable[[], T]) -> T:
+    """
+    `compute()`, cached on disk under the grid's fingerprint if a cache directory is configured and the grid can be
+      fingerprinted.
+    """
+    cache = disk_cache()
+    if cache is None:
+        return compute()
+    from hypergrid.fingerprint import _fingerprint_or_none
+
+    fingerprint = _fingerprint_or_none(grid)
+    if fingerprint is None:
+        return compute()
+    key = f"{fingerprint}-{kind}"
+    value = cache.get(key)
+    if value is _MISSING:
+        value = compute()
+        cache.put(key, value)
+    return value
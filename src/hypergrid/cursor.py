@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterator
+
+if TYPE_CHECKING:
+    from hypergrid.grid import Grid
+
+
+class GridCursor(Iterator):
+    """
+    A resumable iterator over a grid, yielding elements in iteration order.
+
+    `state()` is the grid position of the next element to be examined: a single int in the grid's position space (the
+      mixed-radix index for a HyperGrid, offset into the second child for a SumGrid, and so on).  It is stable across
+      processes for the same grid definition, so a preempted job can persist it and resume with `grid.iter_from(state)`
+      in O(1), without re-running filters on the elements before it.
+    """
+
+    def __init__(self, grid: Grid, state: int = 0) -> None:
+        positions = grid._positions
+        assert 0 <= state <= positions, f"Cursor state must be in [0, {positions}]"
+        self.grid = grid
+        self._position = state
+        self._stop = positions
+
+    def __repr__(self) -> str:
+        return f"GridCursor({repr(self.grid)}, state={self._position})"
+
+    def __iter__(self) -> GridCursor:
+        return self
+
+    def __next__(self) -> tuple:
+        while self._position < self._stop:
+            grid_element = self.grid._at(self._position)
+            self._position += 1
+            if grid_element is not None:
+                return grid_element
+        raise StopIteration
+
+    def state(self) -> int:
+        return self._position
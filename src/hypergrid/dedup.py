@@ -0,0 +1,136 @@
+import math
+import os
+import pickle
+import sqlite3
+import tempfile
+from typing import Hashable, Iterator, Literal, Optional, Protocol
+
+DistinctMethod = Literal["exact", "bloom"]
+
+_MASK64 = (1 << 64) - 1
+
+
+class SeenSet(Protocol):
+    """
+    Tracks which keys have been seen during one pass over a grid.
+    """
+
+    def add(self, key: Hashable) -> bool:
+        """
+        Record `key`, returning whether it was new.
+        """
+        ...
+
+    def close(self) -> None: ...
+
+
+class ExactSet:
+    """
+    An exact seen-set.  Keys are held in memory until there are `spill_after` of them, then moved to a temporary SQLite
+      database (in `directory`, default the system temp dir) indexed by hash, so memory stays bounded for any number of
+      distinct keys.  Spilled keys are pickled and compared with `==`, so equality matches the in-memory set's.
+    """
+
+    def __init__(self, spill_after: Optional[int] = None, directory: Optional[str] = None) -> None:
+        assert spill_after is None or spill_after > 0, "spill_after must be positive"
+        self.spill_after = spill_after
+        self.directory = directory
+        self._memory: set = set()
+        self._db: Optional[sqlite3.Connection] = None
+        self._path: Optional[str] = None
+
+    def __repr__(self) -> str:
+        return f"ExactSet(spill_after={self.spill_after})"
+
+    def add(self, key: Hashable) -> bool:
+        if key in self._memory or (self._db is not None and self._on_disk(key)):
+            return False
+        self._memory.add(key)
+        if self.spill_after is not None and len(self._memory) >= self.spill_after:
+            self._spill()
+        return True
+
+    def _on_disk(self, key: Hashable) -> bool:
+        assert self._db is not None
+        rows = self._db.execute("SELECT key FROM seen WHERE hash = ?", (hash(key),))
+        return any(pickle.loads(row[0]) == key for row in rows)
+
+    def _spill(self) -> None:
+        if self._db is None:
+            fd, self._path = tempfile.mkstemp(suffix=".sqlite", prefix="hypergrid-distinct-", dir=self.directory)
+            os.close(fd)
+            self._db = sqlite3.connect(self._path)
+            self._db.execute("PRAGMA journal_mode = OFF")
+            self._db.execute("PRAGMA synchronous = OFF")
+            self._db.execute("CREATE TABLE seen (hash INTEGER NOT NULL, key BLOB NOT NULL)")
+            self._db.execute("CREATE INDEX seen_hash ON seen (hash)")
+        self._db.executemany("INSERT INTO seen VALUES (?, ?)", ((hash(key), pickle.dumps(key)) for key in self._memory))
+        self._memory.clear()
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+        if self._path is not None:
+            os.remove(self._path)
+            self._path = None
+        self._memory.clear()
+
+
+class BloomFilter:
+    """
+    A Bloom filter sized for `capacity` keys at a false-positive rate of `error_rate`, taking about
+      `-capacity * ln(error_rate) / ln(2)**2` bits.  A false positive drops a key that wasn't actually seen; keys are never
+      let through twice.  Bits are addressed by double hashing of `hash(key)`.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 1e-3) -> None:
+        assert capacity >= 0, "Capacity must be non-negative"
+        assert 0 < error_rate < 1, "Error rate must be in (0, 1)"
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.bits = max(64, math.ceil(-max(capacity, 1) * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.bits / max(capacity, 1) * math.log(2)))
+        self._array = bytearray((self.bits + 7) // 8)
+
+    def __repr__(self) -> str:
+        return f"BloomFilter(capacity={self.capacity}, error_rate={self.error_rate})"
+
+    def __contains__(self, key: Hashable) -> bool:
+        return all(self._array[bit >> 3] & (1 << (bit & 7)) for bit in self._bits(key))
+
+    def add(self, key: Hashable) -> bool:
+        new = False
+        for bit in self._bits(key):
+            byte, mask = bit >> 3, 1 << (bit & 7)
+            if not self._array[byte] & mask:
+                self._array[byte] |= mask
+                new = True
+        return new
+
+    def _bits(self, key: Hashable) -> Iterator[int]:
+        # hash() is the identity on small ints, so it's mixed before use
+        h1 = _mix(hash(key) & _MASK64)
+        h2 = _mix(h1) | 1
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.bits
+
+    def close(self) -> None:
+        pass
+
+
+def seen_set(method: DistinctMethod, capacity: int, spill_after: Optional[int] = None, error_rate: float = 1e-3) -> SeenSet:
+    match method:
+        case "exact":
+            return ExactSet(spill_after)
+        case "bloom":
+            return BloomFilter(capacity, error_rate)
+        case _:
+            raise ValueError(f"Unknown distinct method: {method}")
+
+
+def _mix(value: int) -> int:
+    # splitmix64 finalizer
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return value ^ (value >> 31)
@@ -1,6 +1,7 @@
 import random
-from collections.abc import Collection
-from typing import TYPE_CHECKING, Generic, Iterator, Self, TypeAlias, TypeVar
+from collections.abc import Collection, Mapping, Sequence, Set
+from functools import cached_property
+from typing import TYPE_CHECKING, Generic, Iterator, Optional, Self, TypeAlias, TypeVar
 
 if TYPE_CHECKING:
     from hypergrid.grid import HyperGrid
@@ -31,8 +32,19 @@ class Dimension(Generic[T]):
     def __iter__(self) -> Iterator[T]:
         yield from self.values
 
-    def sample(self) -> T:
-        return random.choice(self.values)  # type: ignore
+    def __getitem__(self, index: int) -> T:
+        return self._indexable[index]
+
+    @cached_property
+    def _indexable(self) -> Sequence[T]:
+        # Sequences and array-likes (e.g. lazy ranges, numpy memmaps) are indexed in place without copying; sets, dicts and
+        #   other unordered collections are snapshotted once in iteration order
+        if isinstance(self.values, Sequence) or (hasattr(self.values, "__getitem__") and not isinstance(self.values, (Mapping, Set))):
+            return self.values  # type: ignore[return-value]
+        return tuple(self.values)
+
+    def sample(self, rng: Optional[random.Random] = None) -> T:
+        return (rng or random).choice(self._indexable)
 
     def with_name(self, name: str) -> Self:
         self.name = name
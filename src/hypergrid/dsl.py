@@ -1,6 +1,63 @@
-from hypergrid.dimension import Dimension
-from hypergrid.gen.distribution import Uniform
-from hypergrid.gen.iterable import ExponentialStep
-from hypergrid.grid import HyperGrid
+import importlib
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["HyperGrid", "Dimension", "Uniform", "ExponentialStep"]
+if TYPE_CHECKING:
+    from hypergrid.dimension import Dimension
+    from hypergrid.gen.distribution import Categorical, IntUniform, LogUniform, Normal, Uniform
+    from hypergrid.gen.iterable import ExponentialStep
+    from hypergrid.gen.space import arange, geomspace, linspace, logspace
+    from hypergrid.grid import HyperGrid
+    from hypergrid.profiling import profile
+
+# Names are imported from their modules on first access (PEP 562), so `import hypergrid.dsl` costs almost nothing and
+#   e.g. a worker that only uses HyperGrid never imports the distributions or the profiler
+_LAZY = {
+    "HyperGrid": "hypergrid.grid",
+    "Dimension": "hypergrid.dimension",
+    "Uniform": "hypergrid.gen.distribution",
+    "LogUniform": "hypergrid.gen.distribution",
+    "Normal": "hypergrid.gen.distribution",
+    "IntUniform": "hypergrid.gen.distribution",
+    "Categorical": "hypergrid.gen.distribution",
+    "ExponentialStep": "hypergrid.gen.iterable",
+    "arange": "hypergrid.gen.space",
+    "linspace": "hypergrid.gen.space",
+    "logspace": "hypergrid.gen.space",
+    "geomspace": "hypergrid.gen.space",
+    "profile": "hypergrid.profiling",
+}
+
+__all__ = [
+    "HyperGrid",
+    "Dimension",
+    "Uniform",
+    "LogUniform",
+    "Normal",
+    "IntUniform",
+    "Categorical",
+    "ExponentialStep",
+    "arange",
+    "linspace",
+    "logspace",
+    "geomspace",
+    "profile",
+]
+
+
+def __getattr__(name: str) -> Any:
+    return _load(name, globals())
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+def _load(name: str, namespace: dict[str, Any]) -> Any:
+    """
+    Import a lazily exported name into `namespace`, so later lookups don't go through `__getattr__` again.
+    """
+    if name not in _LAZY:
+        raise AttributeError(f"module {namespace['__name__']!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name]), name)
+    namespace[name] = value
+    return value
@@ -0,0 +1,34 @@
+import threading
+from collections import namedtuple
+from typing import Iterable
+
+_registry: dict[tuple[str, ...], type[tuple]] = {}
+_registry_lock = threading.Lock()
+
+
+def element_type(fields: Iterable[str]) -> type[tuple]:
+    """
+    The GridElement namedtuple type for a list of field names, created once per distinct field list and then shared.
+
+    Each type is reachable as `hypergrid.element.GridElement[field1,field2,...]` (via the module `__getattr__`), so both
+      grid elements and their types can be pickled and rebuilt in other processes.
+    """
+    key = tuple(fields)
+    if key not in _registry:
+        with _registry_lock:
+            if key not in _registry:
+                _registry[key] = _new_element_type(key)
+    return _registry[key]
+
+
+def _new_element_type(fields: tuple[str, ...]) -> type[tuple]:
+    cls = namedtuple("GridElement", fields, module=__name__)  # type: ignore[misc]
+    cls.__qualname__ = f"GridElement[{','.join(fields)}]"
+    return cls
+
+
+def __getattr__(name: str) -> type[tuple]:
+    if name.startswith("GridElement[") and name.endswith("]"):
+        fields = name[len("GridElement[") : -1]
+        return element_type(fields.split(",") if fields else [])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from functools import partial
+from multiprocessing.context import BaseContext
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Iterator, Literal, Optional
+
+if TYPE_CHECKING:
+    from hypergrid.grid import Grid
+
+ExecutorKind = Literal["process", "thread"]
+
+# Set in each worker process by `_init_worker`, so that tasks only carry positions or elements.  The grid is only set in
+#   forked workers, which inherit it
+_worker_grid: Optional[Grid] = None
+_worker_func: Optional[Callable[..., Any]] = None
+
+
+def run(
+    grid: Grid,
+    func: Callable[[Any], Any],
+    executor: ExecutorKind = "process",
+    workers: Optional[int] = None,
+    chunksize: int = 1024,
+    ordered: bool = True,
+    max_in_flight: Optional[int] = None,
+    mp_context: Optional[BaseContext] = None,
+) -> Iterator:
+    """
+    Evaluate `func` on every grid element in a pool of workers, yielding results as they arrive.
+
+    Work is split into chunks of `chunksize` grid positions, and at most `max_in_flight` chunks (default: twice the number
+      of workers) are outstanding at once, so memory stays bounded for any grid size.
+
+    Process pools use `mp_context`, defaulting to the platform's start method.  Workers are sent each chunk's grid elements,
+      so only `func` needs to be picklable.  Passing `multiprocessing.get_context("fork")` opts into forked workers,
+      which inherit the grid (and `func`) instead, are sent just the (start, stop) range of each chunk and rebuild its
+      elements locally.  Forking is unavailable on Windows, and unsafe on macOS and in parents that have started threads.
+    """
+    assert chunksize > 0, "Chunk size must be positive"
+    workers = workers or os.cpu_count() or 1
+    context = mp_context or multiprocessing.get_context()
+    pool = _make_executor(grid, func, executor, workers, context)
+    in_flight = max_in_flight or 2 * workers
+    positions = grid._positions
+    chunks = ((start, min(start + chunksize, positions)) for start in range(0, positions, chunksize))
+    task: Callable[..., list]
+    tasks: Iterator[tuple]
+    if executor == "thread":
+        task, tasks = partial(_run_grid_positions, grid, func), chunks
+    elif _inherits_grid(context):
+        task, tasks = _run_positions, chunks
+    else:
+        task, tasks = _run_elements, ((list(grid._iter_positions(range(start, stop))),) for start, stop in chunks)
+    try:
+        if ordered:
+            yield from _iter_ordered(pool, task, tasks, in_flight)
+        else:
+            yield from _iter_completed(pool, task, tasks, in_flight)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _make_executor(grid: Grid, func: Callable[..., Any], executor: ExecutorKind, workers: int, context: BaseContext) -> Executor:
+    match executor:
+        case "process":
+            return ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(grid if _inherits_grid(context) else None, func),
+            )
+        case "thread":
+            return ThreadPoolExecutor(max_workers=workers)
+        case _:
+            raise ValueError(f"Unknown executor: {executor}")
+
+
+def _inherits_grid(context: BaseContext) -> bool:
+    # Other start methods would pickle the grid, which fails for the lambdas that filters and maps are usually built from
+    return context.get_start_method() == "fork"
+
+
+def _iter_ordered(pool: Executor, task: Callable[..., list], tasks: Iterator[tuple], in_flight: int) -> Iterator:
+    pending: deque[Future] = deque()
+    for args in tasks:
+        pending.append(pool.submit(task, *args))
+        if len(pending) >= in_flight:
+            yield from pending.popleft().result()
+    while pending:
+        yield from pending.popleft().result()
+
+
+def _iter_completed(pool: Executor, task: Callable[..., list], tasks: Iterator[tuple], in_flight: int) -> Iterator:
+    pending: set[Future] = set()
+    for args in tasks:
+        pending.add(pool.submit(task, *args))
+        if len(pending) >= in_flight:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield from future.result()
+
+
+def _init_worker(grid: Optional[Grid], func: Callable[..., Any]) -> None:
+    global _worker_grid, _worker_func
+    _worker_grid = grid
+    _worker_func = func
+
+
+def _run_positions(start: int, stop: int) -> list:
+    assert _worker_grid is not None and _worker_func is not None, "Worker was not initialized with a grid"
+    return _run_grid_positions(_worker_grid, _worker_func, start, stop)
+
+
+def _run_elements(grid_elements: list) -> list:
+    assert _worker_func is not None, "Worker was not initialized with a function"
+    return [_worker_func(ge) for ge in grid_elements]
+
+
+def _run_grid_positions(grid: Grid, func: Callable[[Any], Any], start: int, stop: int) -> list:
+    return [func(ge) for ge in grid._iter_positions(range(start, stop))]
+
+
+def _evaluate_position(position: int, budget: Any) -> Any:
+    assert _worker_grid is not None and _worker_func is not None, "Worker was not initialized with a grid"
+    return _evaluate_grid_position(_worker_grid, _worker_func, position, budget)
+
+
+def _evaluate_element(grid_element: Any, budget: Any) -> Any:
+    assert _worker_func is not None, "Worker was not initialized with a function"
+    return _worker_func(grid_element, budget)
+
+
+def _evaluate_grid_position(grid: Grid, func: Callable[[Any, Any], Any], position: int, budget: Any) -> Any:
+    return func(grid._at(position), budget)
+
+
+async def aiter_grid(grid: Grid, yield_every: int = 1024) -> AsyncIterator:
+    """
+    Iterate a grid from async code, handing control back to the event loop every `yield_every` elements so that a long
+      synchronous enumeration doesn't starve other coroutines.
+    """
+    assert yield_every > 0, "yield_every must be positive"
+    for index, ge in enumerate(grid, start=1):
+        yield ge
+        if index % yield_every == 0:
+            await asyncio.sleep(0)
+
+
+async def arun(grid: Grid, func: Callable[[Any], Awaitable[Any]], concurrency: int = 16) -> list:
+    """
+    Await `func` on every grid element with at most `concurrency` calls in flight, returning results in grid order.
+
+    A fixed pool of `concurrency` worker coroutines pulls elements from one shared iterator, so the grid is consumed only as
+      fast as results complete and no more than `concurrency` tasks ever exist.  The first exception cancels the rest.
+    """
+    assert concurrency > 0, "Concurrency must be positive"
+    elements = enumerate(grid)
+    results: dict[int, Any] = {}
+
+    async def worker() -> None:
+        # Safe to share: the event loop is single-threaded and `next` never awaits
+        for index, ge in elements:
+            results[index] = await func(ge)
+
+    async with asyncio.TaskGroup() as group:
+        for _ in range(concurrency):
+            group.create_task(worker())
+    return [results[index] for index in range(len(results))]
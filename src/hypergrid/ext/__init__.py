@@ -0,0 +1,11 @@
+import importlib
+from typing import Any
+
+# Optional backends, each importing its third-party library; loaded as `hypergrid.ext.numpy` etc. on first access
+_BACKENDS = ("numpy", "pyarrow", "sklearn")
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _BACKENDS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return importlib.import_module(f"{__name__}.{name}")
@@ -0,0 +1,401 @@
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError("If using columnar functionality, install hypergrid with `numpy` extras via `pip install hypergrid[numpy]`")
+
+import bisect
+import json
+import operator
+from abc import abstractmethod
+from functools import cached_property, reduce, wraps
+from itertools import accumulate, compress, islice
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Mapping, Optional, Sequence, TypeAlias, overload
+
+from hypergrid.dimension import Dimension
+from hypergrid.gen.space import ArithmeticRange, GeometricRange, LogRange
+from hypergrid.grid import FilterGrid, Grid, HyperGrid, MapGrid, MapToGrid, ProductGrid, SelectGrid, SumGrid, ZipGrid
+
+Columns: TypeAlias = dict[str, np.ndarray]
+ColumnFunction: TypeAlias = Callable[[Columns], Any]
+
+_NATIVE_DTYPES: dict[type, type] = {bool: np.bool_, int: np.int64, float: np.float64, str: np.str_}
+
+_NPY_FORMAT = "hypergrid-npy"
+_NPY_VERSION = 1
+
+
+class _BatchGrid:
+    """
+    Shared machinery for grids whose user functions operate on whole column batches rather than single grid elements.
+
+    Subclasses keep the per-element attributes of their parent class working (for `sample`, indexing, etc.) by wrapping
+      each column function in a single-row adapter, and implement `_apply` to transform a batch of parent columns.
+    """
+
+    grid: Grid
+    grid_element: type[tuple]
+    batch_size: int = 65536
+
+    def __iter__(self) -> Iterator:
+        for columns in _iter_batches(self, self.batch_size):  # type: ignore[arg-type]
+            yield from _columns_to_rows(self.grid_element, columns)
+
+    def _iter_positions(self, positions: Iterable[int]) -> Iterator:
+        iterator = iter(positions)
+        while block := list(islice(iterator, self.batch_size)):
+            grid_elements = [ge for ge in map(self.grid._at, block) if ge is not None]
+            if grid_elements:
+                yield from self._apply_rows(grid_elements)
+
+    def _apply_rows(self, grid_elements: list) -> Iterator:
+        return _columns_to_rows(self.grid_element, self._apply(_rows_to_columns(self.grid.dimension_names, grid_elements)))
+
+    @abstractmethod
+    def _apply(self, columns: Columns) -> Columns:
+        """
+        Transform one batch of the parent grid's columns into this grid's columns.
+        """
+
+
+class BatchFilterGrid(_BatchGrid, FilterGrid):
+    def __init__(self, grid: Grid, predicate: ColumnFunction) -> None:
+        super().__init__(grid, _single_row(predicate, grid.dimension_names))
+        self.batch_predicate = predicate
+
+    def __repr__(self) -> str:
+        return f"BatchFilterGrid({repr(self.grid)}, {self.batch_predicate.__name__})"
+
+    @cached_property
+    def _pushed_down(self) -> Optional[Grid]:
+        # A pushed-down FilterGrid would evaluate the column predicate one row at a time
+        return None
+
+    def __iter__(self) -> Iterator:
+        # The parent's own elements are passed through, so a filter never changes the values it lets through
+        iterator = iter(self.grid)
+        while grid_elements := list(islice(iterator, self.batch_size)):
+            yield from self._apply_rows(grid_elements)
+
+    def _count(self) -> int:
+        return sum(int(np.count_nonzero(_evaluate(self.batch_predicate, columns))) for columns in _iter_batches(self.grid, self.batch_size))
+
+    def _apply(self, columns: Columns) -> Columns:
+        mask = _evaluate(self.batch_predicate, columns).astype(bool)
+        return {name: column[mask] for name, column in columns.items()}
+
+    def _apply_rows(self, grid_elements: list) -> Iterator:
+        mask = _evaluate(self.batch_predicate, _rows_to_columns(self.grid.dimension_names, grid_elements)).astype(bool)
+        return compress(grid_elements, mask.tolist())
+
+
+class BatchMapGrid(_BatchGrid, MapGrid):
+    def __init__(self, grid: Grid, **kwargs: ColumnFunction) -> None:
+        super().__init__(grid, **{dim_name: _single_row(func, grid.dimension_names) for dim_name, func in kwargs.items()})
+        self.batch_mapping = kwargs
+
+    def __repr__(self) -> str:
+        mappings_str = ", ".join([f"{dim_name}={func.__name__}" for dim_name, func in self.batch_mapping.items()])
+        return f"BatchMapGrid({repr(self.grid)}, {mappings_str})"
+
+    def _apply(self, columns: Columns) -> Columns:
+        return {dim_name: _evaluate(func, columns) for dim_name, func in self.batch_mapping.items()}
+
+
+class BatchMapToGrid(_BatchGrid, MapToGrid):
+    def __init__(self, grid: Grid, **kwargs: ColumnFunction) -> None:
+        super().__init__(grid, **{dim_name: _single_row(func, grid.dimension_names) for dim_name, func in kwargs.items()})
+        self.batch_mapping = kwargs
+
+    def __repr__(self) -> str:
+        mappings_str = ", ".join([f"{dim_name}={func.__name__}" for dim_name, func in self.batch_mapping.items()])
+        return f"BatchMapToGrid({repr(self.grid)}, {mappings_str})"
+
+    def _apply(self, columns: Columns) -> Columns:
+        return columns | {dim_name: _evaluate(func, columns) for dim_name, func in self.batch_mapping.items()}
+
+
+class ChunkedColumn(Sequence):
+    """
+    One column of a grid written by `Grid.to_npy`, stored as a sequence of `.npy` chunk files.
+
+    Chunks are opened lazily and memory-mapped, so indexing is O(log chunks), a worker only pages in the chunks it reads,
+      and `array(start, stop)` within one chunk is a zero-copy view.  Object columns (e.g. instantiated models) can't be
+      memory-mapped and are unpickled one chunk at a time instead.
+    """
+
+    def __init__(self, files: list[Path], lengths: list[int]) -> None:
+        assert len(files) == len(lengths), "Each chunk file needs a length"
+        self.files = files
+        self.offsets = [0, *accumulate(lengths)]
+        self._chunks: list[Optional[np.ndarray]] = [None] * len(files)
+
+    def __repr__(self) -> str:
+        return f"ChunkedColumn({len(self.files)} chunks, {len(self)} values)"
+
+    def __len__(self) -> int:
+        return self.offsets[-1]
+
+    @overload
+    def __getitem__(self, index: int) -> Any: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list: ...
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        index = operator.index(index)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Column index out of range")
+        chunk = bisect.bisect_right(self.offsets, index) - 1
+        return _to_python(self._chunk(chunk)[index - self.offsets[chunk]])
+
+    def __iter__(self) -> Iterator:
+        for chunk in range(len(self.files)):
+            yield from self._chunk(chunk).tolist()
+
+    def array(self, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """
+        Values [start, stop) as an array, which is a view into the memory map when the range lies within one chunk.
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        first = bisect.bisect_right(self.offsets, start) - 1
+        parts = []
+        for chunk in range(max(first, 0), len(self.files)):
+            if self.offsets[chunk] >= stop:
+                break
+            base = self.offsets[chunk]
+            parts.append(self._chunk(chunk)[max(start - base, 0) : stop - base])
+        if len(parts) == 1:
+            return parts[0]
+        return _concatenate(parts) if parts else np.empty(0)
+
+    def _chunk(self, chunk: int) -> np.ndarray:
+        array = self._chunks[chunk]
+        if array is None:
+            try:
+                array = np.load(self.files[chunk], mmap_mode="r")
+            except ValueError:
+                array = np.load(self.files[chunk], allow_pickle=True)
+            self._chunks[chunk] = array
+        return array
+
+
+def _grid_to_npy(grid: Grid, directory: Path, chunk_size: int) -> None:
+    """
+    Stream the grid to one `.npy` file per column per chunk, plus a `grid.json` manifest, holding one chunk in memory.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    names = grid.dimension_names
+    lengths = []
+    for chunk, columns in enumerate(_iter_batches(grid, chunk_size)):
+        for name in names:
+            np.save(directory / _chunk_file(name, chunk), columns[name], allow_pickle=columns[name].dtype == object)
+        lengths.append(len(columns[names[0]]) if names else 0)
+    manifest = {"format": _NPY_FORMAT, "version": _NPY_VERSION, "columns": names, "lengths": lengths}
+    (directory / "grid.json").write_text(json.dumps(manifest))
+
+
+def _read_npy(directory: Path) -> Grid:
+    manifest = json.loads((directory / "grid.json").read_text())
+    if manifest.get("format") != _NPY_FORMAT or manifest.get("version") != _NPY_VERSION:
+        raise ValueError(f"{directory} is not a hypergrid npy directory")
+    lengths = manifest["lengths"]
+    columns = {name: ChunkedColumn([directory / _chunk_file(name, chunk) for chunk in range(len(lengths))], lengths) for name in manifest["columns"]}
+    return _zip_columns(columns)
+
+
+def _zip_columns(columns: Mapping[str, Sequence]) -> Grid:
+    assert columns, "A grid file needs at least one column"
+    return reduce(operator.and_, [HyperGrid(**{name: values}) for name, values in columns.items()])
+
+
+def _chunk_file(name: str, chunk: int) -> str:
+    return f"{name}.{chunk:06d}.npy"
+
+
+def _to_python(value: Any) -> Any:
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _grid_to_columns(grid: Grid) -> Columns:
+    if _is_index_decodable(grid):
+        return _columns_at(grid, np.arange(len(grid)), {})
+    batches = list(_iter_batches(grid, _BatchGrid.batch_size))
+    if not batches:
+        return _rows_to_columns(grid.dimension_names, [])
+    return {name: _concatenate([batch[name] for batch in batches]) for name in grid.dimension_names}
+
+
+def _iter_batches(grid: Grid, batch_size: int) -> Iterator[Columns]:
+    """
+    Grids built only from HyperGrid, ProductGrid, SumGrid, ZipGrid and SelectGrid are materialized directly from index
+      arithmetic over the dimension arrays, without constructing any grid elements.  Batch grids transform their parent's
+      batches column-wise.  Anything else falls back to iterating the grid and transposing each chunk of rows.
+
+    Batches hold up to `batch_size` grid elements; batch filters may yield shorter batches.
+    """
+    assert batch_size > 0, "Batch size must be positive"
+    match grid:
+        case _ if _is_index_decodable(grid):
+            arrays: dict[int, np.ndarray] = {}
+            length = len(grid)
+            for start in range(0, length, batch_size):
+                yield _columns_at(grid, np.arange(start, min(start + batch_size, length)), arrays)
+        case _BatchGrid():
+            for columns in _iter_batches(grid.grid, batch_size):
+                columns = grid._apply(columns)
+                if len(next(iter(columns.values()))) > 0:
+                    yield columns
+        case SelectGrid():
+            for columns in _iter_batches(grid._source, batch_size):
+                yield {name: columns[name] for name in grid.dimension_names}
+        case _:
+            iterator = iter(grid)
+            while rows := list(islice(iterator, batch_size)):
+                yield _rows_to_columns(grid.dimension_names, rows)
+
+
+def _is_index_decodable(grid: Grid) -> bool:
+    match grid:
+        case HyperGrid():
+            return True
+        case ProductGrid() | SumGrid() | ZipGrid():
+            return _is_index_decodable(grid.grid1) and _is_index_decodable(grid.grid2)
+        case SelectGrid():
+            return _is_index_decodable(grid._source)
+        case _:
+            return False
+
+
+def _columns_at(grid: Grid, indices: np.ndarray, arrays: dict[int, np.ndarray]) -> Columns:
+    """
+    Vectorized counterpart of `Grid._getitem`.  `arrays` caches each dimension's values as an array across batches.
+    """
+    match grid:
+        case HyperGrid():
+            columns = {}
+            for dim in reversed(grid.dimensions):
+                indices, offsets = np.divmod(indices, len(dim))
+                if id(dim) not in arrays:
+                    arrays[id(dim)] = _dimension_to_array(dim)
+                columns[dim.name] = arrays[id(dim)][offsets]
+            return {name: columns[name] for name in grid.dimension_names}
+        case ProductGrid():
+            indices1, indices2 = np.divmod(indices, len(grid.grid2))
+            return _columns_at(grid.grid1, indices1, arrays) | _columns_at(grid.grid2, indices2, arrays)
+        case SumGrid():
+            len1 = len(grid.grid1)
+            mask = indices < len1
+            columns1 = _columns_at(grid.grid1, indices[mask], arrays)
+            columns2 = _columns_at(grid.grid2, indices[~mask] - len1, arrays)
+            columns = {}
+            for name in grid.dimension_names:
+                column = np.empty(len(indices), dtype=_common_dtype(columns1[name].dtype, columns2[name].dtype))
+                column[mask] = columns1[name]
+                column[~mask] = columns2[name]
+                columns[name] = column
+            return columns
+        case ZipGrid():
+            return _columns_at(grid.grid1, indices, arrays) | _columns_at(grid.grid2, indices, arrays)
+        case SelectGrid():
+            columns = _columns_at(grid._source, indices, arrays)
+            return {name: columns[name] for name in grid.dimension_names}
+        case _:
+            raise ValueError(f"Grid cannot be decoded into columns by index: {grid!r}")
+
+
+def _dimension_to_array(dim: Dimension) -> np.ndarray:
+    match dim.values:
+        case np.ndarray() if dim.values.ndim == 1:
+            return dim.values
+        case range():
+            return np.arange(dim.values.start, dim.values.stop, dim.values.step)
+        case ArithmeticRange():
+            return _arithmetic_array(dim.values)
+        case GeometricRange() | LogRange():
+            # NumPy's vectorized power can differ from Python's in the last bit, and columns must match iteration exactly
+            return np.fromiter(dim.values, dtype=np.float64, count=len(dim.values))
+        case ChunkedColumn():
+            return dim.values.array()
+        case _:
+            return _to_array(list(dim))
+
+
+def _arithmetic_array(values: ArithmeticRange) -> np.ndarray:
+    array = values.start + values.step * np.arange(values.num, dtype=np.float64)
+    if values.last is not None:
+        array[-1] = values.last
+    return array
+
+
+def _rows_to_columns(names: list[str], rows: list) -> Columns:
+    # Rows are read by name, since SumGrid may yield elements whose fields are ordered differently
+    return {name: _to_array([getattr(row, name) for row in rows]) for name in names}
+
+
+def _columns_to_rows(grid_element: type[tuple], columns: Columns) -> Iterator[tuple]:
+    # `tolist` converts numpy scalars back into python values
+    return map(grid_element._make, zip(*[column.tolist() for column in columns.values()]))  # type: ignore[attr-defined]
+
+
+def _single_row(func: ColumnFunction, dim_names: list[str]) -> Callable[[Any], Any]:
+    @wraps(func)
+    def single_row_func(ge: tuple) -> Any:
+        return _evaluate(func, _rows_to_columns(dim_names, [ge])).tolist()[0]
+
+    return single_row_func
+
+
+def _evaluate(func: ColumnFunction, columns: Columns) -> np.ndarray:
+    # Scalar results (e.g. constants) are broadcast across the batch
+    length = len(next(iter(columns.values())))
+    result = func(columns)
+    if isinstance(result, np.ndarray) and result.shape == (length,):
+        return result
+    return np.broadcast_to(_to_array(result) if isinstance(result, list) else np.asarray(result), (length,))
+
+
+def _concatenate(arrays: list[np.ndarray]) -> np.ndarray:
+    dtype = reduce(_common_dtype, [array.dtype for array in arrays])
+    return np.concatenate([array.astype(dtype, copy=False) for array in arrays])
+
+
+def _to_array(values: Sequence[Any]) -> np.ndarray:
+    """
+    Convert to a typed array when the values are homogeneously bool/int/float/str, and an object array otherwise.
+
+    We avoid letting numpy infer the dtype directly because it silently coerces mixed values (e.g. [1, "a"] to strings,
+      or [1, 2.5] to floats), and `tolist` must give back the values we started with.
+    """
+    types = {type(v) for v in values}
+    if len(types) == 1 and (dtype := _NATIVE_DTYPES.get(next(iter(types)))) is not None:
+        try:
+            return np.asarray(values, dtype=dtype)
+        except OverflowError:
+            pass
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+def _common_dtype(dtype1: np.dtype, dtype2: np.dtype) -> np.dtype:
+    # Only promote within one kind, since numpy would otherwise coerce e.g. ints to floats or strings
+    if dtype1.kind == dtype2.kind != "O":
+        return np.result_type(dtype1, dtype2)
+    return np.dtype(object)
+
+
+def _generator(rng: Optional[np.random.Generator]) -> np.random.Generator:
+    return rng if rng is not None else np.random.default_rng()
+
+
+def _geometric_array(start: float, step: float, n: int) -> np.ndarray:
+    return start * step ** np.arange(n, dtype=np.float64)
+
+
+def _spawned_generator(seed: int, index: int) -> np.random.Generator:
+    return np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(index,)))
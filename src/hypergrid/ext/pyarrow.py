@@ -0,0 +1,76 @@
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    raise ImportError("If using parquet functionality, install hypergrid with `parquet` extras via `pip install hypergrid[parquet]`")
+
+import bisect
+import operator
+from itertools import accumulate
+from pathlib import Path
+from typing import Any, Iterator, Optional, Sequence, overload
+
+from hypergrid.ext.numpy import _iter_batches, _zip_columns
+from hypergrid.grid import Grid
+
+
+class ArrowColumn(Sequence):
+    """
+    A read-only view of one column of an Arrow table, indexed without converting the column to Python objects.
+    """
+
+    def __init__(self, column: pa.ChunkedArray) -> None:  # type: ignore[no-any-unimported]
+        self.column = column
+        self.offsets = [0, *accumulate(len(chunk) for chunk in column.chunks)]
+
+    def __repr__(self) -> str:
+        return f"ArrowColumn({self.column.type}, {len(self)} values)"
+
+    def __len__(self) -> int:
+        return len(self.column)
+
+    @overload
+    def __getitem__(self, index: int) -> Any: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list: ...
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        index = operator.index(index)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Column index out of range")
+        chunk = bisect.bisect_right(self.offsets, index) - 1
+        return self.column.chunks[chunk][index - self.offsets[chunk]].as_py()
+
+    def __iter__(self) -> Iterator:
+        for chunk in self.column.chunks:
+            yield from chunk.to_pylist()
+
+
+def _grid_to_parquet(grid: Grid, path: Path, chunk_size: int) -> None:
+    """
+    Stream the grid to a parquet file with one row group per chunk.  The schema is inferred from the first chunk.
+    """
+    writer: Optional[pq.ParquetWriter] = None  # type: ignore[no-any-unimported]
+    try:
+        for columns in _iter_batches(grid, chunk_size):
+            table = pa.table({name: pa.array(values) for name, values in columns.items()})
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table.cast(writer.schema))
+        if writer is None:
+            schema = pa.schema([(name, pa.null()) for name in grid.dimension_names])
+            writer = pq.ParquetWriter(path, schema)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def _read_parquet(path: Path) -> Grid:
+    # Parquet pages are compressed, so columns are decoded into Arrow memory (from a memory-mapped file) rather than used in place
+    table = pq.read_table(path, memory_map=True)
+    return _zip_columns({name: ArrowColumn(table.column(name)) for name in table.column_names})
@@ -1,32 +1,126 @@
 try:
     from sklearn.model_selection import ParameterGrid
+    from sklearn.model_selection._search import BaseSearchCV
 except ImportError:
     raise ImportError("If using sklearn conversion functionality, install hypergrid with `sklearn` extras via `pip install hypergrid[sklearn]`")
 
-from hypergrid.grid import Grid, HyperGrid, ProductGrid
+from collections.abc import Sequence
+from typing import Any, Callable, Iterator, Optional, overload
 
+import numpy as np
 
-def _grid_to_sklearn(grid: Grid) -> ParameterGrid:  # type: ignore[no-any-unimported]
+from hypergrid.grid import Grid, HyperGrid, ProductGrid, SumGrid
+
+
+class ParameterSequence(Sequence[dict]):
+    """
+    A lazy list of parameter dicts backed by a grid, for grids with no ParameterGrid equivalent (filters, zips, maps...).
+
+    Like ParameterGrid it supports `len`, indexing and iteration, but elements are produced by the grid's own indexing on
+      demand, so a huge grid is never materialized as a list of dicts.  sklearn's GridSearchCV only accepts dicts of
+      value lists as `param_grid`, so search over one with `HyperGridSearchCV` instead.
     """
-    SKLearn's ParameterGrid accepts {str: sequence}
+
+    def __init__(self, grid: Grid) -> None:
+        self.grid = grid
+
+    def __repr__(self) -> str:
+        return f"ParameterSequence({repr(self.grid)})"
+
+    def __len__(self) -> int:
+        return len(self.grid)
+
+    @overload
+    def __getitem__(self, index: int) -> dict: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[dict]: ...
+
+    def __getitem__(self, index: int | slice) -> dict | list[dict]:
+        if isinstance(index, slice):
+            return [ge._asdict() for ge in self.grid[index]]
+        return self.grid[index]._asdict()
+
+    def __iter__(self) -> Iterator[dict]:
+        for ge in self.grid:
+            yield ge._asdict()
+
+
+class HyperGridSearchCV(BaseSearchCV):  # type: ignore[no-any-unimported]
+    """
+    Exhaustive search over the elements of a grid, e.g. `HyperGridSearchCV(SVC(), grid.filter(...), cv=5).fit(X, y)`.
+
+    A drop-in for sklearn's GridSearchCV, taking the same arguments except that `param_grid` is any Grid, including
+      filtered, zipped or mapped grids that GridSearchCV can't express.  Each grid element's `_asdict()` is one candidate.
+    """
+
+    _parameter_constraints: dict = {**BaseSearchCV._parameter_constraints, "param_grid": [Grid]}
+
+    def __init__(
+        self,
+        estimator: Any,
+        param_grid: Grid,
+        *,
+        scoring: Any = None,
+        n_jobs: Optional[int] = None,
+        refit: bool | str | Callable = True,
+        cv: Any = None,
+        verbose: int = 0,
+        pre_dispatch: int | str = "2*n_jobs",
+        error_score: float | str = np.nan,
+        return_train_score: bool = False,
+    ) -> None:
+        super().__init__(
+            estimator=estimator,
+            scoring=scoring,
+            n_jobs=n_jobs,
+            refit=refit,
+            cv=cv,
+            verbose=verbose,
+            pre_dispatch=pre_dispatch,
+            error_score=error_score,
+            return_train_score=return_train_score,
+        )
+        self.param_grid = param_grid
+
+    def _run_search(self, evaluate_candidates: Callable[[Any], Any]) -> None:
+        evaluate_candidates(_grid_to_sklearn(self.param_grid))
+
+
+def _grid_to_sklearn(grid: Grid) -> ParameterGrid | ParameterSequence:  # type: ignore[no-any-unimported]
+    """
+    SKLearn's ParameterGrid accepts {str: sequence}, or a list of them whose grids are concatenated.
 
     Because these ParameterGrids don't directly compose, we use a recursive helper, and then convert the composable dicts
-      into a ParameterGrid in this outer wrapper.
+      into a ParameterGrid in this outer wrapper.  Grids that can't be expressed this way are wrapped lazily instead.
     """
-    return ParameterGrid(_grid_to_sklearn_recursive_helper(grid))
+    param_grid = _grid_to_sklearn_recursive_helper(grid)
+    if param_grid is None:
+        return ParameterSequence(grid)
+    return ParameterGrid(param_grid)
 
 
-def _grid_to_sklearn_recursive_helper(grid: Grid) -> dict:
+def _grid_to_sklearn_recursive_helper(grid: Grid) -> Optional[list[dict]]:
     """
-    SKLearn's param_grid dictionaries only support simple cartesian products, so only the Grid and ProductGrid elements
-      are convertible to SKLearn parameter grids.
+    SKLearn's param_grid dictionaries only support simple cartesian products, and lists of them concatenate, so HyperGrid,
+      ProductGrid and SumGrid (with products distributed over sums) are convertible.  Anything else returns None.
+
+    Dimension values are passed through as sequences rather than copied, so lazy ranges stay lazy.
     """
     match grid:
         case HyperGrid():
-            return {dim.name: [v for v in dim] for dim in grid.dimensions}
+            return [{dim.name: dim._indexable for dim in grid.dimensions}]
         case ProductGrid():
-            d1 = _grid_to_sklearn_recursive_helper(grid.grid1)
-            d2 = _grid_to_sklearn_recursive_helper(grid.grid2)
-            return d1 | d2
+            ds1 = _grid_to_sklearn_recursive_helper(grid.grid1)
+            ds2 = _grid_to_sklearn_recursive_helper(grid.grid2)
+            if ds1 is None or ds2 is None:
+                return None
+            return [d1 | d2 for d1 in ds1 for d2 in ds2]
+        case SumGrid():
+            ds1 = _grid_to_sklearn_recursive_helper(grid.grid1)
+            ds2 = _grid_to_sklearn_recursive_helper(grid.grid2)
+            if ds1 is None or ds2 is None:
+                return None
+            return ds1 + ds2
         case _:
-            raise ValueError("Converting Grid to SKLearn ParameterGrid is not compatible with")
+            return None
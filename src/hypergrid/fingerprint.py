@@ -0,0 +1,150 @@
+import hashlib
+import types
+from functools import partial
+from typing import Any, Optional
+
+from hypergrid.gen.space import LazyRange
+from hypergrid.grid import DistinctGrid, FilterGrid, Grid, HyperGrid, MapGrid, MapToGrid, ProductGrid, SelectGrid, SumGrid, ZipGrid
+from hypergrid.plan import CompiledGrid
+
+
+class _Undescribable(Exception):
+    """
+    Raised when a grid reaches a value whose state can't be fully described, so it has no fingerprint.
+    """
+
+
+def fingerprint(grid: Grid) -> str:
+    """
+    A SHA-256 hex digest of the grid's structure: its node types, dimension names and values, and the code, constants,
+      closures and referenced globals of its functions.  Grids declared the same way get the same fingerprint in any
+      process, so it can key caches of derived results on disk.
+
+    Only values that can be described in full contribute: primitives, containers, ranges, arrays and functions built
+      from them.  A grid whose functions reach a module, a class or any other object (e.g. a predicate reading
+      `cfg.LIMIT`) has state that could change without changing its description, so it raises ValueError instead.
+      Unordered collections of strings iterate in a per-process order, which costs cache misses but never a wrong hit.
+    """
+    result = _fingerprint_or_none(grid)
+    if result is None:
+        raise ValueError("Can't fingerprint a grid with nodes or functions whose state can't be fully described")
+    return result
+
+
+def _fingerprint_or_none(grid: Grid) -> Optional[str]:
+    try:
+        description = _describe_grid(grid)
+    except _Undescribable:
+        return None
+    return None if description is None else hashlib.sha256(repr(description).encode()).hexdigest()
+
+
+def _describe_grid(grid: Grid) -> Optional[tuple]:
+    tag = (type(grid).__module__, type(grid).__qualname__)
+    match grid:
+        case HyperGrid():
+            return (*tag, tuple((dim.name, _describe(dim.values)) for dim in grid.dimensions))
+        case SumGrid() | ProductGrid() | ZipGrid():
+            return _describe_children(tag, grid.grid1, grid.grid2)
+        case FilterGrid():
+            return _describe_children((*tag, _describe(grid.predicate)), grid.grid)
+        case SelectGrid():
+            return _describe_children((*tag, grid.select_dims), grid.grid)
+        case MapGrid() | MapToGrid():
+            return _describe_children((*tag, _describe(grid.dimension_mapping)), grid.grid)
+        case DistinctGrid():
+            return _describe_children((*tag, grid.method, grid.error_rate), grid.grid)
+        case CompiledGrid():
+            return _describe_children((*tag, grid.as_tuples), grid.grid)
+        case _:
+            return None
+
+
+def _describe_children(node: tuple, *grids: Grid) -> Optional[tuple]:
+    children = [_describe_grid(grid) for grid in grids]
+    if any(child is None for child in children):
+        return None
+    return (*node, *children)
+
+
+def _describe(value: Any, seen: Optional[set[int]] = None) -> Any:
+    """
+    A nested tuple of primitives describing a value, whose `repr` is stable across processes where the value allows.
+      Raises `_Undescribable` for values with state that the description would miss.
+    """
+    seen = set() if seen is None else seen
+    match value:
+        case None | bool() | int() | float() | complex() | str() | bytes():
+            return value
+        case range():
+            return ("range", value.start, value.stop, value.step)
+        case LazyRange():
+            return (type(value).__qualname__, _describe(vars(value), seen))
+        case type() | types.ModuleType():
+            # Class and module attributes can be reassigned at any time, e.g. `cfg.LIMIT = 8`
+            raise _Undescribable(value)
+        case types.CodeType():
+            return _describe_code(value, seen)
+        case partial():
+            return ("partial", _describe(value.func, seen), _describe(value.args, seen), _describe(value.keywords, seen))
+        case types.FunctionType() | types.MethodType() if id(value) in seen:
+            return ("recursive", value.__qualname__)
+        case types.FunctionType():
+            return _describe_function(value, seen)
+        case types.MethodType():
+            return ("method", _describe(value.__func__, seen), _describe(value.__self__, seen))
+        case Grid():
+            description = _describe_grid(value)
+            if description is None:
+                raise _Undescribable(value)
+            return description
+        case dict():
+            return ("dict", tuple((_describe(k, seen), _describe(v, seen)) for k, v in value.items()))
+        case tuple() | list() | set() | frozenset():
+            return (type(value).__qualname__, tuple(_describe(item, seen) for item in value))
+        case _ if hasattr(value, "dtype") and hasattr(value, "tobytes"):
+            # NumPy arrays and memmaps
+            return ("array", str(value.dtype), value.shape, hashlib.sha256(value.tobytes()).hexdigest())
+        case _ if hasattr(value, "__wrapped__"):
+            # e.g. memoized functions, whose caches aren't part of their identity
+            return ("wrapped", type(value).__qualname__, _describe(value.__wrapped__, seen))
+        case _ if not callable(value) and hasattr(value, "__len__") and hasattr(value, "__iter__"):
+            return (type(value).__qualname__, tuple(_describe(item, seen) for item in value))
+        case _:
+            raise _Undescribable(value)
+
+
+def _describe_function(func: types.FunctionType, seen: set[int]) -> tuple:
+    seen.add(id(func))
+    # Globals the code reads (e.g. a threshold constant) are part of its behaviour, so they're described too
+    referenced = {name: func.__globals__[name] for name in sorted(_global_names(func.__code__)) if name in func.__globals__}
+    closure = tuple(_cell_contents(cell) for cell in func.__closure__ or ())
+    return (
+        "function",
+        func.__module__,
+        func.__qualname__,
+        _describe(func.__code__, seen),
+        _describe(func.__defaults__, seen),
+        _describe(func.__kwdefaults__, seen),
+        _describe(closure, seen),
+        _describe(referenced, seen),
+    )
+
+
+def _cell_contents(cell: types.CellType) -> Any:
+    try:
+        return cell.cell_contents
+    except ValueError:  # A closure variable that hasn't been assigned yet
+        return None
+
+
+def _describe_code(code: types.CodeType, seen: set[int]) -> tuple:
+    return ("code", code.co_code, code.co_names, tuple(_describe(const, seen) for const in code.co_consts))
+
+
+def _global_names(code: types.CodeType) -> set[str]:
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _global_names(const)
+    return names
@@ -1,14 +1,36 @@
+from __future__ import annotations
+
+import bisect
+import itertools
+import math
 import random
-from typing import Any, Iterator, Protocol, TypeVar, runtime_checkable
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional, Protocol, Sequence, TypeVar, runtime_checkable
 
 from hypergrid.gen.iterable import HIterable
 
+if TYPE_CHECKING:
+    import numpy as np
+
 T = TypeVar("T", covariant=True)
 
 
 @runtime_checkable
 class Distribution(HIterable, Protocol[T]):
-    def sample(self) -> T: ...
+    def sample(self, rng: Optional[random.Random] = None) -> T: ...
+
+    def sample_batch(self, n: int, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        """
+        Draw n independent samples as a NumPy array.  Distributions override this with a vectorized draw from `rng`;
+          the default falls back to calling `sample` n times, with a `random.Random` seeded from `rng` if one is given.
+          Requires hypergrid[numpy].
+        """
+        from hypergrid.ext.numpy import _to_array
+
+        py_rng = None if rng is None else random.Random(int(rng.integers(2**63)))
+        return _to_array([self.sample(py_rng) for _ in range(n)])
+
+    def take_array(self, n: int) -> np.ndarray:
+        return self.sample_batch(n)
 
     def __iter__(self) -> Iterator[T]:
         while True:
@@ -23,5 +45,120 @@ class Uniform(Distribution):
         self.low = low
         self.high = high
 
-    def sample(self) -> float:
-        return random.uniform(self.low, self.high)
+    def sample(self, rng: Optional[random.Random] = None) -> float:
+        return (rng or random).uniform(self.low, self.high)
+
+    def ppf(self, q: Any) -> Any:
+        return self.low + q * (self.high - self.low)
+
+    def sample_batch(self, n: int, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        from hypergrid.ext.numpy import _generator
+
+        return _generator(rng).uniform(self.low, self.high, n)
+
+
+class LogUniform(Distribution):
+    """
+    Uniform in log space between two positive bounds, e.g. for learning rates.
+    """
+
+    def __init__(self, low: float, high: float) -> None:
+        assert 0 < low <= high, "LogUniform bounds must be positive"
+        self.low = low
+        self.high = high
+
+    def sample(self, rng: Optional[random.Random] = None) -> float:
+        return self.ppf((rng or random).random())
+
+    def ppf(self, q: Any) -> Any:
+        return self.low * (self.high / self.low) ** q
+
+    def sample_batch(self, n: int, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        from hypergrid.ext.numpy import _generator
+
+        return self.ppf(_generator(rng).random(n))
+
+
+class Normal(Distribution):
+    def __init__(self, mean: float, std: float) -> None:
+        assert std >= 0, "Standard deviation must be non-negative"
+        self.mean = mean
+        self.std = std
+
+    def sample(self, rng: Optional[random.Random] = None) -> float:
+        return (rng or random).gauss(self.mean, self.std)
+
+    def ppf(self, q: Any) -> Any:
+        if self.std == 0:
+            return _map_quantiles(lambda _: self.mean, q)
+        from statistics import NormalDist
+
+        return _map_quantiles(NormalDist(self.mean, self.std).inv_cdf, q)
+
+    def sample_batch(self, n: int, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        from hypergrid.ext.numpy import _generator
+
+        return _generator(rng).normal(self.mean, self.std, n)
+
+
+class IntUniform(Distribution):
+    """
+    Uniform over the integers in [low, high], inclusive of both ends like `random.randint`.
+    """
+
+    def __init__(self, low: int, high: int) -> None:
+        assert low <= high, "IntUniform needs low <= high"
+        self.low = low
+        self.high = high
+
+    def sample(self, rng: Optional[random.Random] = None) -> int:
+        return (rng or random).randint(self.low, self.high)
+
+    def ppf(self, q: Any) -> Any:
+        if isinstance(q, (int, float)):
+            return self.low + math.floor(q * (self.high - self.low + 1))
+        return self.low + (q * (self.high - self.low + 1)).astype(int)
+
+    def sample_batch(self, n: int, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        from hypergrid.ext.numpy import _generator
+
+        return _generator(rng).integers(self.low, self.high, n, endpoint=True)
+
+
+class Categorical(Distribution):
+    """
+    Draws from a finite set of values, uniformly or with the given (unnormalized) weights.
+    """
+
+    def __init__(self, values: Sequence, weights: Optional[Sequence[float]] = None) -> None:
+        assert len(values) > 0, "Categorical needs at least one value"
+        assert weights is None or len(weights) == len(values), "Categorical needs one weight per value"
+        self.values = values
+        self.weights = weights
+
+    def sample(self, rng: Optional[random.Random] = None) -> Any:
+        return (rng or random).choices(self.values, weights=self.weights)[0]
+
+    def ppf(self, q: Any) -> Any:
+        weights = self.weights if self.weights is not None else [1] * len(self.values)
+        cumulative = list(itertools.accumulate(weights))
+        return _map_quantiles(lambda x: self.values[bisect.bisect_right(cumulative, x * cumulative[-1])], q)
+
+    def sample_batch(self, n: int, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        from hypergrid.ext.numpy import _generator, _to_array
+
+        p = None
+        if self.weights is not None:
+            total = sum(self.weights)
+            p = [weight / total for weight in self.weights]
+        # Draw indices rather than values, so the values keep their types (numpy would coerce e.g. [1, "a"] to strings)
+        return _to_array(self.values)[_generator(rng).choice(len(self.values), n, p=p)]
+
+
+def _map_quantiles(func: Callable[[float], Any], q: Any) -> Any:
+    # Inverse CDFs without a closed form that numpy can broadcast are applied one quantile at a time
+    if isinstance(q, (int, float)):
+        return func(q)
+    from hypergrid.ext.numpy import _to_array
+
+    return _to_array([func(x) for x in q.tolist()])
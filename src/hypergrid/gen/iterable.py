@@ -1,7 +1,13 @@
-from itertools import islice
-from typing import Iterator, Protocol, Self, TypeVar, runtime_checkable
+from __future__ import annotations
+
+from itertools import count, islice
+from typing import TYPE_CHECKING, Iterator, Protocol, Self, TypeVar, runtime_checkable
 
 from hypergrid.dimension import Dimension
+from hypergrid.gen.space import GeometricRange
+
+if TYPE_CHECKING:
+    import numpy as np
 
 T = TypeVar("T")
 
@@ -15,6 +21,14 @@ class HIterable(Protocol[T]):
     def take(self, n: int) -> Dimension[T]:
         return Dimension(**{self.name: [i for i in islice(self, n)]})
 
+    def take_array(self, n: int) -> np.ndarray:
+        """
+        The first n values as a NumPy array.  Requires hypergrid[numpy].
+        """
+        from hypergrid.ext.numpy import _to_array
+
+        return _to_array(list(islice(self, n)))
+
     def with_name(self, name: str) -> Self:
         self.name = name
         return self
@@ -26,7 +40,18 @@ class ExponentialStep(HIterable):
         self.step = step
 
     def __iter__(self) -> Iterator[float]:
-        cursor = self.start
-        while True:
-            yield cursor
-            cursor *= self.step
+        # Computed as `start * step**i` rather than by repeated multiplication, so values match `take` exactly and rounding
+        #   errors don't accumulate
+        for i in count():
+            yield self.start * self.step**i
+
+    def take(self, n: int) -> Dimension[float]:
+        return Dimension(**{self.name: GeometricRange(self.start, self.step, n)})
+
+    def take_array(self, n: int) -> np.ndarray:
+        """
+        The first n values, computed in one vectorized step.  NumPy's power may differ from iteration in the last bit.
+        """
+        from hypergrid.ext.numpy import _geometric_array
+
+        return _geometric_array(self.start, self.step, n)
@@ -0,0 +1,202 @@
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError("If using quasi-random sampling, install hypergrid with `numpy` extras via `pip install hypergrid[numpy]`")
+
+import operator
+from functools import reduce
+from typing import Literal, Optional, Protocol, TypeAlias
+
+from hypergrid.gen.distribution import Distribution
+from hypergrid.grid import FilterGrid, Grid, HyperGrid, MapGrid, MapToGrid, ProductGrid, SelectGrid
+
+QuasiMethod = Literal["halton", "lhs", "sobol"]
+Seed: TypeAlias = int | np.random.Generator | None
+
+# `sample_grid` gives up after this many consecutive points are rejected by filters
+_MAX_REJECTED = 2**20
+
+
+class QuasiSampler(Protocol):
+    """
+    Generates points in the unit hypercube [0, 1)^d, in batches of shape (n, d).  Consecutive calls continue the sequence.
+    """
+
+    d: int
+
+    def random(self, n: int) -> np.ndarray: ...
+
+
+class Halton(QuasiSampler):
+    """
+    The Halton sequence (radical inverses in the first d prime bases), randomized by a Cranley-Patterson shift so that
+      repeated runs don't all start from the same points.  Pass `seed` for reproducible shifts.
+    """
+
+    def __init__(self, d: int, seed: Seed = None) -> None:
+        assert d > 0, "Halton sequences need at least one dimension"
+        self.d = d
+        self.bases = _primes(d)
+        self.shift = np.random.default_rng(seed).random(d)
+        self._index = 1
+
+    def __repr__(self) -> str:
+        return f"Halton(d={self.d})"
+
+    def random(self, n: int) -> np.ndarray:
+        indices = np.arange(self._index, self._index + n, dtype=np.int64)
+        self._index += n
+        points = np.column_stack([_radical_inverse(indices, base) for base in self.bases]).reshape(n, self.d)
+        return (points + self.shift) % 1.0
+
+
+class LatinHypercube(QuasiSampler):
+    """
+    Latin hypercube sampling: each batch of n points has exactly one point in each of the n equal strata of every
+      dimension, jittered uniformly within its stratum.
+    """
+
+    def __init__(self, d: int, seed: Seed = None) -> None:
+        assert d > 0, "Latin hypercubes need at least one dimension"
+        self.d = d
+        self.rng = np.random.default_rng(seed)
+
+    def __repr__(self) -> str:
+        return f"LatinHypercube(d={self.d})"
+
+    def random(self, n: int) -> np.ndarray:
+        strata = self.rng.permuted(np.tile(np.arange(n), (self.d, 1)), axis=1).T
+        return (strata + self.rng.random((n, self.d))) / n
+
+
+class Sobol(QuasiSampler):
+    """
+    The scrambled Sobol sequence, via `scipy.stats.qmc`.  Batch sizes that are powers of 2 keep its balance properties.
+    """
+
+    def __init__(self, d: int, seed: Seed = None) -> None:
+        try:
+            from scipy.stats import qmc
+        except ImportError:
+            raise ImportError("Sobol sampling requires scipy, e.g. via `pip install scipy` or `pip install hypergrid[sklearn]`")
+        self.d = d
+        self._engine = qmc.Sobol(d, scramble=True, seed=np.random.default_rng(seed))
+
+    def __repr__(self) -> str:
+        return f"Sobol(d={self.d})"
+
+    def random(self, n: int) -> np.ndarray:
+        return self._engine.random(n)
+
+
+def make_sampler(method: QuasiMethod, d: int, seed: Seed = None) -> QuasiSampler:
+    match method:
+        case "halton":
+            return Halton(d, seed)
+        case "lhs":
+            return LatinHypercube(d, seed)
+        case "sobol":
+            return Sobol(d, seed)
+        case _:
+            raise ValueError(f"Unknown quasi-random method: {method}")
+
+
+def sample_grid(grid: Grid, n: int, method: QuasiMethod = "halton", seed: Seed = None) -> list:
+    """
+    Sample n grid elements with a low-discrepancy or stratified sequence over the grid's position space.
+
+    When the grid's positions are a cartesian product (HyperGrids, their products, and filters, selections and maps over
+      them), each dimension's index is drawn from its own coordinate of a d-dimensional sequence, so every dimension is
+      evenly covered.  Other grids use a 1-d sequence over positions.  Positions rejected by filters are skipped and more
+      points are drawn until n elements are found.
+    """
+    assert n >= 0, "Sample size must be non-negative"
+    radices = _radices(grid) or [grid._positions]
+    if 0 in radices:
+        raise ValueError("Cannot sample from an empty grid")
+    sampler = make_sampler(method, len(radices), seed)
+    strides = [reduce(operator.mul, radices[i + 1 :], 1) for i in range(len(radices))]
+    # Selective filters can reject whole batches, so we only give up after enough consecutive rejections to cover a small
+    #   grid's positions several times over
+    patience = min(4 * reduce(operator.mul, radices, 1), _MAX_REJECTED)
+    samples: list = []
+    batch = max(n, 1)
+    rejected = 0
+    while len(samples) < n:
+        # Clip in case floating point rounding lands a point exactly on the upper edge
+        indices = np.minimum(np.floor(sampler.random(batch) * radices).astype(np.int64), np.array(radices) - 1)
+        accepted = len(samples)
+        for row in indices.tolist():
+            grid_element = grid._at(sum(index * stride for index, stride in zip(row, strides)))
+            if grid_element is not None:
+                samples.append(grid_element)
+        if len(samples) > accepted:
+            rejected = 0
+            continue
+        rejected += batch
+        if rejected >= patience:
+            raise ValueError("Quasi-random sampling found no elements, the grid may be filtered to empty")
+        batch = min(2 * batch, patience)
+    return samples[:n]
+
+
+def quasi_grid(n: int, method: QuasiMethod = "halton", seed: Seed = None, **distributions: Distribution) -> Grid:
+    """
+    A grid of n points drawn jointly from continuous distributions by their inverse CDFs, e.g.
+      `quasi_grid(64, "sobol", lr=Uniform(1e-4, 1e-1), dropout=Uniform(0, 0.5))`.  Dimensions are zipped together.
+      Each distribution must define `ppf`, its inverse CDF, accepting a NumPy array of quantiles in [0, 1).
+    """
+    assert distributions, "At least one distribution is required"
+    ppfs = {}
+    for name, distribution in distributions.items():
+        if not hasattr(distribution, "ppf"):
+            raise TypeError(f"{type(distribution).__name__} for dimension {name!r} does not define an inverse CDF (ppf)")
+        ppfs[name] = distribution.ppf
+    points = make_sampler(method, len(ppfs), seed).random(n)
+    grids = [HyperGrid(**{name: np.asarray(ppf(points[:, i])).tolist()}) for i, (name, ppf) in enumerate(ppfs.items())]
+    return reduce(operator.and_, grids)
+
+
+def _radices(grid: Grid) -> Optional[list[int]]:
+    """
+    Per-dimension sizes when the grid's position space is a mixed-radix product, with the last dimension varying fastest.
+    """
+    match grid:
+        case HyperGrid():
+            return [len(dim) for dim in grid.dimensions]
+        case ProductGrid():
+            radices1 = _radices(grid.grid1)
+            radices2 = _radices(grid.grid2)
+            if radices1 is None or radices2 is None:
+                return None
+            return radices1 + radices2
+        case FilterGrid() if grid._pushed_down is not None:
+            # Positions index the pushed-down grid, which may have fewer values per dimension than the parent
+            return _radices(grid._pushed_down)
+        case SelectGrid():
+            return _radices(grid._source)
+        case FilterGrid() | MapGrid() | MapToGrid():
+            return _radices(grid.grid)
+        case _:
+            return None
+
+
+def _radical_inverse(indices: np.ndarray, base: int) -> np.ndarray:
+    result = np.zeros(len(indices))
+    remaining = indices.copy()
+    scale = 1.0 / base
+    while remaining.any():
+        result += (remaining % base) * scale
+        remaining //= base
+        scale /= base
+    return result
+
+
+def _primes(count: int) -> list[int]:
+    primes: list[int] = []
+    candidate = 2
+    while len(primes) < count:
+        if all(candidate % prime for prime in primes if prime * prime <= candidate):
+            primes.append(candidate)
+        candidate += 1
+    return primes
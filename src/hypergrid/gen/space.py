@@ -0,0 +1,157 @@
+import math
+import operator
+from abc import abstractmethod
+from collections.abc import Sequence
+from typing import Iterator, Optional, overload
+
+
+class LazyRange(Sequence[float]):
+    """
+    A sequence of `num` values computed from their index on access, so length, indexing and sampling are O(1) and e.g.
+      `Dimension(x=linspace(0, 1, 10**8))` costs nothing until it's touched.
+    """
+
+    num: int
+
+    def __len__(self) -> int:
+        return self.num
+
+    @overload
+    def __getitem__(self, index: int) -> float: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[float]: ...
+
+    def __getitem__(self, index: int | slice) -> float | list[float]:
+        if isinstance(index, slice):
+            return [self._value(i) for i in range(*index.indices(self.num))]
+        return self._value(_normalize(index, self.num))
+
+    def __iter__(self) -> Iterator[float]:
+        for i in range(self.num):
+            yield self._value(i)
+
+    @abstractmethod
+    def _value(self, i: int) -> float:
+        """
+        The value at a non-negative, in-bounds index.
+        """
+
+
+class ArithmeticRange(LazyRange):
+    """
+    A float-friendly `range`: `num` values `start + i * step`.  If `last` is given it replaces the final value, so that
+      e.g. `linspace` ends exactly on its endpoint despite rounding in `step`.
+    """
+
+    def __init__(self, start: float, step: float, num: int, last: Optional[float] = None) -> None:
+        assert num >= 0, "Range length must be non-negative"
+        self.start = start
+        self.step = step
+        self.num = num
+        self.last = last
+
+    def __repr__(self) -> str:
+        return f"ArithmeticRange(start={self.start!r}, step={self.step!r}, num={self.num!r})"
+
+    def _value(self, i: int) -> float:
+        if self.last is not None and i == self.num - 1:
+            return self.last
+        return self.start + i * self.step
+
+
+class GeometricRange(LazyRange):
+    """
+    A geometric progression: `num` values `start * ratio**i`.
+    """
+
+    def __init__(self, start: float, ratio: float, num: int) -> None:
+        assert num >= 0, "Range length must be non-negative"
+        self.start = start
+        self.ratio = ratio
+        self.num = num
+
+    def __repr__(self) -> str:
+        return f"GeometricRange(start={self.start!r}, ratio={self.ratio!r}, num={self.num!r})"
+
+    def _value(self, i: int) -> float:
+        return self.start * self.ratio**i
+
+
+class LogRange(LazyRange):
+    """
+    `num` values `scale * base**e`, for exponents e evenly spaced from `start` to `stop` inclusive (as in `numpy.logspace`).
+
+    Values are computed from their evenly spaced exponents rather than by repeated multiplication, so they stay accurate
+      over very long ranges.  If `first` or `last` is given it replaces the first or final value, so that e.g. `geomspace`
+      starts and ends exactly on its endpoints despite rounding in the logarithms.
+    """
+
+    def __init__(
+        self,
+        start: float,
+        stop: float,
+        num: int,
+        base: float = 10.0,
+        scale: float = 1.0,
+        first: Optional[float] = None,
+        last: Optional[float] = None,
+    ) -> None:
+        assert num >= 0, "Range length must be non-negative"
+        self.exponents = linspace(start, stop, num)
+        self.base = base
+        self.scale = scale
+        self.num = num
+        self.first = first
+        self.last = last
+
+    def __repr__(self) -> str:
+        return f"LogRange(exponents={self.exponents!r}, base={self.base!r}, scale={self.scale!r})"
+
+    def _value(self, i: int) -> float:
+        if self.first is not None and i == 0:
+            return self.first
+        if self.last is not None and i == self.num - 1:
+            return self.last
+        return self.scale * self.base ** self.exponents._value(i)
+
+
+def arange(start: float, stop: float, step: float = 1) -> ArithmeticRange:
+    assert step != 0, "Step must be non-zero"
+    return ArithmeticRange(start, step, max(0, math.ceil((stop - start) / step)))
+
+
+def linspace(start: float, stop: float, num: int, endpoint: bool = True) -> ArithmeticRange:
+    intervals = num - 1 if endpoint else num
+    return ArithmeticRange(start, (stop - start) / intervals if intervals > 0 else 0, num, last=stop if endpoint and num > 1 else None)
+
+
+def logspace(start: float, stop: float, num: int, base: float = 10.0) -> LogRange:
+    """
+    `num` values from `base**start` to `base**stop`, evenly spaced in log space (as in `numpy.logspace`).
+    """
+    return LogRange(start, stop, num, base)
+
+
+def geomspace(start: float, stop: float, num: int) -> LogRange:
+    """
+    `num` values from `start` to `stop`, each a constant multiple of the previous (as in `numpy.geomspace`).
+    """
+    assert start != 0 and stop / start > 0, "Geometric ranges need non-zero endpoints of the same sign"
+    return LogRange(
+        math.log10(abs(start)),
+        math.log10(abs(stop)),
+        num,
+        scale=math.copysign(1, start),
+        first=float(start) if num > 0 else None,
+        last=float(stop) if num > 1 else None,
+    )
+
+
+def _normalize(index: int, length: int) -> int:
+    index = operator.index(index)
+    if index < 0:
+        index += length
+    if not 0 <= index < length:
+        raise IndexError("Range index out of range")
+    return index
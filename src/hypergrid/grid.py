@@ -1,25 +1,45 @@
 from __future__ import annotations
 
 import itertools
+import operator
+import os
 import random
-from collections import namedtuple
 from collections.abc import Collection
 from functools import cached_property
 from math import prod
-from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Iterable, Iterator, Optional, Protocol, Self, runtime_checkable
 
+from hypergrid.element import element_type
 from hypergrid.gen.iterable import HIterable
-from hypergrid.util import instantiate_lambda
+from hypergrid.permutation import IndexPermutation
+from hypergrid.util import dependencies, instantiate_lambda
 
 if TYPE_CHECKING:
+    from multiprocessing.context import BaseContext
+
+    import numpy as np
     from sklearn.model_selection import ParameterGrid
 
+    from hypergrid.cursor import GridCursor
+    from hypergrid.dedup import DistinctMethod
+    from hypergrid.execution import ExecutorKind
+    from hypergrid.ext.numpy import BatchFilterGrid, BatchMapGrid, BatchMapToGrid
+    from hypergrid.ext.sklearn import ParameterSequence
+    from hypergrid.gen.quasi import QuasiMethod
+    from hypergrid.plan import CompiledGrid
+    from hypergrid.search import SearchResult
+
 from hypergrid.dimension import Dimension, RawDimension
 
+# Iterables longer than this are streamed in chunks by `_product` rather than pooled whole by `itertools.product`
+_POOL_LIMIT = 2**20
+_CHUNK_SIZE = 2**16
+
 
 @runtime_checkable
 class Grid(Protocol):
     grid_element: type[tuple]
+    rng: Optional[random.Random] = None
 
     @property
     def dimension_names(self) -> list[str]:
@@ -32,12 +52,115 @@ class Grid(Protocol):
 
     def __len__(self) -> int: ...
 
+    def sample_quasi(self, n: int, method: QuasiMethod = "halton", seed: Optional[int] = None) -> list:
+        """
+        Sample n grid elements with a low-discrepancy ("halton", "sobol") or stratified ("lhs") sequence over the grid's
+          dimension indices, covering the grid more evenly than independent samples.  Requires hypergrid[numpy].
+        """
+        from hypergrid.gen.quasi import sample_grid
+
+        return sample_grid(self, n, method=method, seed=seed)
+
+    def estimate_len(self, samples: int = 1000) -> int:
+        """
+        Estimate `len()` by sampling through any FilterGrids in the tree, instead of running their predicates over every
+          element.  Exact for grids without filters.
+        """
+        return len(self)
+
     def __iter__(self) -> Iterator: ...
 
     def take(self, n: int) -> list:
         return [i for i in itertools.islice(self, n)]
 
-    def sample(self) -> tuple: ...
+    def __getitem__(self, key: int | slice) -> Any:
+        """
+        Random access into the grid, in the same order as `__iter__`.  Slices return a list of grid elements.
+        """
+        if isinstance(key, slice):
+            return [self._getitem(i) for i in range(*key.indices(len(self)))]
+        index = operator.index(key)
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("Grid index out of range")
+        return self._getitem(index)
+
+    def _getitem(self, index: int) -> tuple:
+        """
+        Fetch the element at a non-negative, in-bounds index.
+        """
+        ...
+
+    def shard(self, index: int, count: int, strided: bool = False) -> Iterator:
+        """
+        Iterate only the elements owned by worker `index` out of `count` workers.  Shards are disjoint and together cover
+          the grid, and each shard costs time proportional to its share rather than to the whole grid.
+
+        Contiguous shards (the default) split the grid into consecutive blocks, so chaining shards 0..count-1 reproduces
+          iteration order.  Strided shards take every `count`-th element starting at `index`.
+        """
+        assert count > 0, "Shard count must be positive"
+        assert 0 <= index < count, "Shard index must be in [0, count)"
+        positions = self._positions
+        if strided:
+            return self._iter_positions(range(index, positions, count))
+        return self._iter_positions(range(positions * index // count, positions * (index + 1) // count))
+
+    def iter_from(self, state: int = 0) -> GridCursor:
+        """
+        Iterate from a saved cursor state, e.g. `cursor = grid.iter_from(checkpoint)`, persisting `cursor.state()` as work
+          progresses.  Resuming is O(1) and doesn't re-run filters on the elements before `state`.
+        """
+        from hypergrid.cursor import GridCursor
+
+        return GridCursor(self, state)
+
+    @property
+    def _positions(self) -> int:
+        """
+        Size of the grid's position space.  This is `len()` unless there is a FilterGrid in the tree, in which case rejected
+          positions are still counted so that positions can be addressed without running predicates up front.
+        """
+        return len(self)
+
+    def _at(self, position: int) -> Optional[tuple]:
+        """
+        Fetch the element at a position, or None if a filter rejects it.
+        """
+        return self._getitem(position)
+
+    def _iter_positions(self, positions: Iterable[int]) -> Iterator:
+        for position in positions:
+            grid_element = self._at(position)
+            if grid_element is not None:
+                yield grid_element
+
+    def sample(self, rng: Optional[random.Random] = None) -> tuple: ...
+
+    def with_seed(self, seed: int) -> Self:
+        """
+        Give the grid its own random stream, used by `sample`, `shuffled` and `sample_unique` (and passed down to sub-grids)
+          instead of the global `random` module.  See `hypergrid.rng.spawn` for independent streams per worker.
+        """
+        self.rng = random.Random(seed)
+        return self
+
+    def shuffled(self, rng: Optional[random.Random] = None) -> Iterator:
+        """
+        Iterate the grid in a random order without repeating any position, using memory independent of the grid's size.
+        """
+        return self._iter_positions(IndexPermutation(self._positions, rng=rng or self.rng))
+
+    def sample_unique(self, k: int, rng: Optional[random.Random] = None) -> list:
+        """
+        Sample k grid elements from distinct positions, using memory bounded by k.
+        """
+        samples = list(itertools.islice(self.shuffled(rng), k))
+        if len(samples) < k:
+            raise ValueError("Sample larger than grid")
+        return samples
 
     def __add__(self, other: Grid | Dimension | RawDimension) -> SumGrid:
         match other:
@@ -89,14 +212,206 @@ class Grid(Protocol):
     def map_to(self, **kwargs: Callable[[Any], Any]) -> MapToGrid:
         return MapToGrid(self, **kwargs)
 
+    def filter_batch(self, predicate: Callable[[dict[str, np.ndarray]], Any]) -> BatchFilterGrid:
+        """
+        Like `filter`, but the predicate receives a dict of NumPy column arrays and returns a boolean mask.
+        """
+        from hypergrid.ext.numpy import BatchFilterGrid
+
+        return BatchFilterGrid(self, predicate)
+
+    def map_batch(self, **kwargs: Callable[[dict[str, np.ndarray]], Any]) -> BatchMapGrid:
+        """
+        Like `map`, but each function receives a dict of NumPy column arrays and returns a column.
+        """
+        from hypergrid.ext.numpy import BatchMapGrid
+
+        return BatchMapGrid(self, **kwargs)
+
+    def map_to_batch(self, **kwargs: Callable[[dict[str, np.ndarray]], Any]) -> BatchMapToGrid:
+        """
+        Like `map_to`, but each function receives a dict of NumPy column arrays and returns a column.
+        """
+        from hypergrid.ext.numpy import BatchMapToGrid
+
+        return BatchMapToGrid(self, **kwargs)
+
     def instantiate(self, **kwargs: type) -> MapToGrid:
         return self.map_to(**{name: instantiate_lambda(cls) for name, cls in kwargs.items()})
 
-    def to_sklearn(self) -> ParameterGrid:  # type: ignore[no-any-unimported]
+    def distinct(self, method: DistinctMethod = "exact", spill_after: Optional[int] = None, error_rate: float = 1e-3) -> DistinctGrid:
+        """
+        Drop repeated elements, e.g. where a SumGrid's sub-grids overlap or a map/select collapses several elements onto
+          one.  `method="exact"` keeps every distinct element seen so far, in a temporary SQLite file once there are more
+          than `spill_after`; `method="bloom"` uses a fixed-size Bloom filter that may drop an element with probability
+          about `error_rate`.
+        """
+        return DistinctGrid(self, method=method, spill_after=spill_after, error_rate=error_rate)
+
+    def fingerprint(self) -> str:
+        """
+        A stable hash of the grid's structure (dimensions, operators and function code), equal for grids declared the same
+          way in any process.  Derived results are cached on disk under it, see `hypergrid.cache.set_cache_dir`.
+        """
+        from hypergrid.fingerprint import fingerprint
+
+        return fingerprint(self)
+
+    def compile(self, as_tuples: bool = False) -> CompiledGrid:
+        """
+        Fuse chains of filter/select/map/map_to layers into a single iteration loop.  The result is equivalent to this grid,
+          except that `as_tuples=True` yields plain value tuples instead of grid elements.
+        """
+        from hypergrid.plan import CompiledGrid
+
+        return CompiledGrid(self, as_tuples=as_tuples)
+
+    def run(
+        self,
+        func: Callable[[Any], Any],
+        executor: ExecutorKind = "process",
+        workers: Optional[int] = None,
+        chunksize: int = 1024,
+        ordered: bool = True,
+        mp_context: Optional[BaseContext] = None,
+    ) -> Iterator:
+        """
+        Evaluate `func` on every grid element in a process or thread pool, yielding results in grid order (or in completion
+          order if `ordered=False`).  Process workers use `mp_context` (default: the platform's start method) and need only
+          `func` to be picklable; see `hypergrid.execution.run` for opting into forked workers.
+        """
+        from hypergrid.execution import run
+
+        return run(self, func, executor=executor, workers=workers, chunksize=chunksize, ordered=ordered, mp_context=mp_context)
+
+    def successive_halving(
+        self,
+        objective: Callable[[Any, Any], float],
+        budget: float,
+        eta: int = 3,
+        min_budget: float = 1,
+        n: Optional[int] = None,
+        maximize: bool = False,
+        executor: ExecutorKind = "process",
+        workers: Optional[int] = None,
+        rng: Optional[random.Random] = None,
+        mp_context: Optional[BaseContext] = None,
+    ) -> SearchResult:
+        """
+        Early-stopping search: evaluate `objective(ge, budget)` on sampled elements at a small budget, and re-evaluate only
+          the best 1/eta of them at eta times the budget, up to `budget`.  See `hypergrid.search.successive_halving`.
+        """
+        from hypergrid.search import successive_halving
+
+        return successive_halving(
+            self,
+            objective,
+            budget,
+            eta=eta,
+            min_budget=min_budget,
+            n=n,
+            maximize=maximize,
+            executor=executor,
+            workers=workers,
+            rng=rng,
+            mp_context=mp_context,
+        )
+
+    def hyperband(
+        self,
+        objective: Callable[[Any, Any], float],
+        budget: float,
+        eta: int = 3,
+        min_budget: float = 1,
+        maximize: bool = False,
+        executor: ExecutorKind = "process",
+        workers: Optional[int] = None,
+        rng: Optional[random.Random] = None,
+        mp_context: Optional[BaseContext] = None,
+    ) -> SearchResult:
+        """
+        Successive halving over brackets that trade more candidates for smaller starting budgets.  See
+          `hypergrid.search.hyperband`.
+        """
+        from hypergrid.search import hyperband
+
+        return hyperband(
+            self,
+            objective,
+            budget,
+            eta=eta,
+            min_budget=min_budget,
+            maximize=maximize,
+            executor=executor,
+            workers=workers,
+            rng=rng,
+            mp_context=mp_context,
+        )
+
+    def aiter(self, yield_every: int = 1024) -> AsyncIterator:
+        """
+        `async for ge in grid.aiter()`, yielding to the event loop every `yield_every` elements.
+        """
+        from hypergrid.execution import aiter_grid
+
+        return aiter_grid(self, yield_every=yield_every)
+
+    async def arun(self, func: Callable[[Any], Awaitable[Any]], concurrency: int = 16) -> list:
+        """
+        Await an async function on every grid element with at most `concurrency` calls in flight, returning results in
+          grid order.
+        """
+        from hypergrid.execution import arun
+
+        return await arun(self, func, concurrency=concurrency)
+
+    def to_sklearn(self) -> ParameterGrid | ParameterSequence:  # type: ignore[no-any-unimported]
+        """
+        Convert to a ParameterGrid when the grid is built from HyperGrid, ProductGrid and SumGrid, and otherwise to a lazy
+          `ParameterSequence` of dicts with the same `len` and indexing.  GridSearchCV only accepts the former: to search
+          any grid, pass it to `hypergrid.ext.sklearn.HyperGridSearchCV` instead.
+        """
         from hypergrid.ext.sklearn import _grid_to_sklearn
 
         return _grid_to_sklearn(self)
 
+    def to_columns(self) -> dict[str, np.ndarray]:
+        """
+        Materialize the grid as one NumPy array per dimension, in iteration order.
+        """
+        from hypergrid.ext.numpy import _grid_to_columns
+
+        return _grid_to_columns(self)
+
+    def iter_batches(self, batch_size: int = 65536) -> Iterator[dict[str, np.ndarray]]:
+        """
+        Iterate the grid as dicts of NumPy arrays per dimension, holding up to `batch_size` grid elements each.
+        """
+        from hypergrid.ext.numpy import _iter_batches
+
+        return _iter_batches(self, batch_size)
+
+    def to_npy(self, directory: str | os.PathLike, chunk_size: int = 65536) -> None:
+        """
+        Write the grid to a directory of `.npy` column chunks, streaming `chunk_size` elements at a time.  Read it back,
+          memory-mapped, with `HyperGrid.from_file(directory)`.  Requires hypergrid[numpy].
+        """
+        from pathlib import Path
+
+        from hypergrid.ext.numpy import _grid_to_npy
+
+        _grid_to_npy(self, Path(directory), chunk_size)
+
+    def to_parquet(self, path: str | os.PathLike, chunk_size: int = 65536) -> None:
+        """
+        Write the grid to a parquet file with one row group per `chunk_size` elements.  Requires pyarrow.
+        """
+        from pathlib import Path
+
+        from hypergrid.ext.pyarrow import _grid_to_parquet
+
+        _grid_to_parquet(self, Path(path), chunk_size)
+
 
 class HyperGrid(Grid):
     dimensions: list[Dimension]
@@ -108,7 +423,26 @@ class HyperGrid(Grid):
         assert len(dims) > 0, "Must provide at least one meaningful dimension"
         assert len(dims) == len(set(dims)), "Dimension names must be unique"
         self.dimensions = dims
-        self.grid_element = namedtuple("GridElement", [dim.name for dim in self.dimensions])  # type: ignore[misc]
+        self.grid_element = element_type([dim.name for dim in self.dimensions])
+
+    @staticmethod
+    def from_file(path: str | os.PathLike) -> Grid:
+        """
+        Open a grid written by `to_npy` (a directory) or `to_parquet` (a file), as a zip of one HyperGrid per column.
+
+        Columns are read lazily with O(1)-ish indexing, so `shard`, `sample` and `__getitem__` only touch the rows they
+          use.  `.npy` chunks are memory-mapped, so workers on one node share pages instead of each holding a copy.
+        """
+        from pathlib import Path
+
+        path = Path(path)
+        if path.is_dir():
+            from hypergrid.ext.numpy import _read_npy
+
+            return _read_npy(path)
+        from hypergrid.ext.pyarrow import _read_parquet
+
+        return _read_parquet(path)
 
     def __repr__(self) -> str:
         dim_str = ", ".join([repr(dim) for dim in self.dimensions])
@@ -118,11 +452,20 @@ class HyperGrid(Grid):
         return prod([len(dim) for dim in self.dimensions])
 
     def __iter__(self) -> Iterator:
-        for element_tuple in itertools.product(*[dim.__iter__() for dim in self.dimensions]):
+        for element_tuple in _product(self.dimensions):
             yield self.grid_element(*element_tuple)
 
-    def sample(self) -> tuple:
-        return self.grid_element(*tuple([dim.sample() for dim in self.dimensions]))
+    def _getitem(self, index: int) -> tuple:
+        # Mixed-radix decode: the last dimension varies fastest, matching itertools.product
+        values = []
+        for dim in reversed(self.dimensions):
+            index, offset = divmod(index, len(dim))
+            values.append(dim[offset])
+        return self.grid_element(*reversed(values))
+
+    def sample(self, rng: Optional[random.Random] = None) -> tuple:
+        rng = rng or self.rng
+        return self.grid_element(*tuple([dim.sample(rng) for dim in self.dimensions]))
 
 
 class SumGrid(Grid):
@@ -136,14 +479,48 @@ class SumGrid(Grid):
         return f"SumGrid({repr(self.grid1)}, {repr(self.grid2)})"
 
     def __len__(self) -> int:
-        return len(self.grid1) + len(self.grid2)
+        return sum(self._lengths)
+
+    @cached_property
+    def _lengths(self) -> tuple[int, int]:
+        # Sub-grid lengths and positions are cached so that indexing or sampling a deeply nested sum doesn't recompute
+        #   every sub-grid's length at every level
+        return len(self.grid1), len(self.grid2)
+
+    def estimate_len(self, samples: int = 1000) -> int:
+        return self.grid1.estimate_len(samples) + self.grid2.estimate_len(samples)
 
     def __iter__(self) -> Iterator:
-        for grid_element in itertools.chain(self.grid1, self.grid2):
-            yield grid_element
+        # Chaining the leaves of a nested sum directly means elements don't pass through one generator per level
+        return itertools.chain.from_iterable(_sum_leaves(self))
 
-    def sample(self) -> tuple:
-        return random.choice([ge for ge in self])
+    def _getitem(self, index: int) -> tuple:
+        len1 = self._lengths[0]
+        if index < len1:
+            return self.grid1._getitem(index)
+        return self.grid2._getitem(index - len1)
+
+    @cached_property
+    def _positions(self) -> int:
+        return self._positions1 + self.grid2._positions
+
+    @cached_property
+    def _positions1(self) -> int:
+        return self.grid1._positions
+
+    def _at(self, position: int) -> Optional[tuple]:
+        positions1 = self._positions1
+        if position < positions1:
+            return self.grid1._at(position)
+        return self.grid2._at(position - positions1)
+
+    def sample(self, rng: Optional[random.Random] = None) -> tuple:
+        rng = rng or self.rng
+        # Picking a sub-grid weighted by its length keeps the sample uniform over the concatenation
+        len1, len2 = self._lengths
+        if (rng or random).randrange(len1 + len2) < len1:
+            return self.grid1.sample(rng)
+        return self.grid2.sample(rng)
 
 
 class ProductGrid(Grid):
@@ -151,7 +528,7 @@ class ProductGrid(Grid):
         assert set(grid1.dimension_names).isdisjoint(set(grid2.dimension_names)), "Dimensions must be exactly matching"
         self.grid1 = grid1
         self.grid2 = grid2
-        self.grid_element = namedtuple("GridElement", grid1.dimension_names + grid2.dimension_names)  # type: ignore[misc]
+        self.grid_element = element_type(grid1.dimension_names + grid2.dimension_names)
 
     def __repr__(self) -> str:
         return f"ProductGrid({repr(self.grid1)}, {repr(self.grid2)})"
@@ -159,13 +536,41 @@ class ProductGrid(Grid):
     def __len__(self) -> int:
         return len(self.grid1) * len(self.grid2)
 
+    def estimate_len(self, samples: int = 1000) -> int:
+        return self.grid1.estimate_len(samples) * self.grid2.estimate_len(samples)
+
     def __iter__(self) -> Iterator:
-        for grid_element1, grid_element2 in itertools.product(self.grid1, self.grid2):
-            yield self.grid_element(*(grid_element1 + grid_element2))
+        # grid1 is streamed once and grid2 is pooled, unless grid2 is too large to pool and re-iterating it runs no filters
+        #   or maps, so that each of its elements is still only built by user functions once
+        grid2: Iterable[tuple] = self.grid2
+        if not (_runs_no_functions(self.grid2) and len(self.grid2) > _POOL_LIMIT):
+            grid2 = list(self.grid2)
+        for grid_element1 in self.grid1:
+            for grid_element2 in grid2:
+                yield self.grid_element(*(grid_element1 + grid_element2))
+
+    def _getitem(self, index: int) -> tuple:
+        index1, index2 = divmod(index, len(self.grid2))
+        return self.grid_element(*(self.grid1._getitem(index1) + self.grid2._getitem(index2)))
 
-    def sample(self) -> tuple:
-        ge1 = self.grid1.sample()
-        ge2 = self.grid2.sample()
+    @property
+    def _positions(self) -> int:
+        return self.grid1._positions * self.grid2._positions
+
+    def _at(self, position: int) -> Optional[tuple]:
+        position1, position2 = divmod(position, self.grid2._positions)
+        grid_element1 = self.grid1._at(position1)
+        if grid_element1 is None:
+            return None
+        grid_element2 = self.grid2._at(position2)
+        if grid_element2 is None:
+            return None
+        return self.grid_element(*(grid_element1 + grid_element2))
+
+    def sample(self, rng: Optional[random.Random] = None) -> tuple:
+        rng = rng or self.rng
+        ge1 = self.grid1.sample(rng)
+        ge2 = self.grid2.sample(rng)
         return self.grid_element(*(ge1 + ge2))
 
 
@@ -178,7 +583,7 @@ class ZipGrid(Grid):
         assert set(grid1.dimension_names).isdisjoint(set(grid2.dimension_names)), "Dimensions must be exactly matching"
         self.grid1 = grid1
         self.grid2 = grid2
-        self.grid_element = namedtuple("GridElement", grid1.dimension_names + grid2.dimension_names)  # type: ignore[misc]
+        self.grid_element = element_type(grid1.dimension_names + grid2.dimension_names)
 
     def __repr__(self) -> str:
         return f"ZipGrid({repr(self.grid1)}, {repr(self.grid2)})"
@@ -186,16 +591,23 @@ class ZipGrid(Grid):
     def __len__(self) -> int:
         return min(len(self.grid1), len(self.grid2))
 
+    def estimate_len(self, samples: int = 1000) -> int:
+        return min(self.grid1.estimate_len(samples), self.grid2.estimate_len(samples))
+
     def __iter__(self) -> Iterator:
         for grid_element1, grid_element2 in zip(self.grid1, self.grid2):
             yield self.grid_element(*(grid_element1 + grid_element2))
 
-    def sample(self) -> tuple:
-        return random.choice([ge for ge in self])
+    def _getitem(self, index: int) -> tuple:
+        return self.grid_element(*(self.grid1._getitem(index) + self.grid2._getitem(index)))
+
+    def sample(self, rng: Optional[random.Random] = None) -> tuple:
+        return self._getitem((rng or self.rng or random).randrange(len(self)))
 
 
 class FilterGrid(Grid):
     _iter_cache: Optional[list] = None
+    max_rejections: int = 1000
 
     def __init__(self, grid: Grid, predicate: Callable[[Any], bool]) -> None:
         self.grid = grid
@@ -210,20 +622,88 @@ class FilterGrid(Grid):
 
     @cached_property
     def _len(self) -> int:
-        return len([x for x in self])
+        if self._pushed_down is not None:
+            return len(self._pushed_down)
+        if self._iter_cache is not None:
+            return len(self._iter_cache)
+        from hypergrid.cache import _disk_cached
+
+        return _disk_cached(self, "len", self._count)
+
+    def _count(self) -> int:
+        # Count through the fused iterator, which reuses the element built for the predicate instead of copying it
+        from hypergrid.plan import CompiledGrid
+
+        return sum(1 for _ in CompiledGrid(self))
+
+    def estimate_len(self, samples: int = 1000) -> int:
+        if self._pushed_down is not None:
+            return self._pushed_down.estimate_len(samples)
+        if "_len" in self.__dict__ or self._iter_cache is not None:
+            return len(self)
+        parent_estimate = self.grid.estimate_len(samples)
+        if parent_estimate == 0:
+            return 0
+        accepted = sum(1 for _ in range(samples) if self.predicate(self.grid.sample()))
+        return round(parent_estimate * accepted / samples)
+
+    @cached_property
+    def _pushed_down(self) -> Optional[Grid]:
+        """
+        An equivalent grid with the predicate applied below a ProductGrid, HyperGrid, etc. when it only reads fields owned
+          by one side, so that rejected combinations are never generated.  All methods delegate to it when present.
+        """
+        fields = dependencies(self.predicate)
+        if fields is None or not fields:
+            return None
+        return _push_filter_down(self.grid, self.predicate, fields)
 
     def __iter__(self) -> Iterator:
+        if self._pushed_down is not None:
+            yield from self._pushed_down
+            return
         for grid_element in self.grid:
             if self.predicate(grid_element):
                 yield grid_element
 
-    def sample(self) -> tuple:
-        if self._iter_cache is not None:
-            sublist = self._iter_cache
-        else:
-            sublist = [ge for ge in self]
-            self._iter_cache = sublist
-        return random.choice(sublist)
+    def _getitem(self, index: int) -> tuple:
+        if self._pushed_down is not None:
+            return self._pushed_down._getitem(index)
+        # Surviving positions can't be computed without running the predicate, so random access uses the materialized cache
+        return self._materialize()[index]
+
+    @property
+    def _positions(self) -> int:
+        if self._pushed_down is not None:
+            return self._pushed_down._positions
+        return self.grid._positions
+
+    def _at(self, position: int) -> Optional[tuple]:
+        if self._pushed_down is not None:
+            return self._pushed_down._at(position)
+        grid_element = self.grid._at(position)
+        if grid_element is None or not self.predicate(grid_element):
+            return None
+        return grid_element
+
+    def sample(self, rng: Optional[random.Random] = None) -> tuple:
+        rng = rng or self.rng
+        if self._pushed_down is not None:
+            return self._pushed_down.sample(rng)
+        # Rejection sampling from the parent is uniform and needs no memory; very selective predicates fall back to the cache
+        if self._iter_cache is None:
+            for _ in range(self.max_rejections):
+                grid_element = self.grid.sample(rng)
+                if self.predicate(grid_element):
+                    return grid_element
+        return (rng or random).choice(self._materialize())
+
+    def _materialize(self) -> list:
+        if self._iter_cache is None:
+            from hypergrid.cache import _disk_cached
+
+            self._iter_cache = _disk_cached(self, "contents", lambda: [ge for ge in self])
+        return self._iter_cache
 
 
 class SelectGrid(Grid):
@@ -232,7 +712,7 @@ class SelectGrid(Grid):
         assert set(select_dims) <= set(grid.dimension_names), "Selected dimensions must be subset of grid dimensions"
         self.grid = grid
         self.select_dims = select_dims
-        self.grid_element = namedtuple("GridElement", [name for name in grid.dimension_names if name in self.select_dims])  # type: ignore[misc]
+        self.grid_element = element_type([name for name in grid.dimension_names if name in self.select_dims])
 
     def __repr__(self) -> str:
         return f"SelectGrid({repr(self.grid)}, {repr(self.select_dims)})"
@@ -240,12 +720,44 @@ class SelectGrid(Grid):
     def __len__(self) -> int:
         return len(self.grid)
 
+    def estimate_len(self, samples: int = 1000) -> int:
+        return self.grid.estimate_len(samples)
+
+    @cached_property
+    def _source(self) -> Grid:
+        """
+        The parent grid, minus any MapGrid/MapToGrid functions whose outputs are dropped by this selection.
+        """
+        match self.grid:
+            case MapGrid() | MapToGrid() if type(self.grid) in (MapGrid, MapToGrid):
+                kept = {name: func for name, func in self.grid.dimension_mapping.items() if name in self.select_dims}
+                if len(kept) == len(self.grid.dimension_mapping):
+                    return self.grid
+                if isinstance(self.grid, MapToGrid) and not kept:
+                    return self.grid.grid
+                return type(self.grid)(self.grid.grid, **kept)
+            case _:
+                return self.grid
+
     def __iter__(self) -> Iterator:
-        for grid_element in self.grid:
+        for grid_element in self._source:
             yield self.grid_element(*self._process_single(grid_element))
 
-    def sample(self) -> tuple:
-        return self.grid_element(*self._process_single(self.grid.sample()))
+    def _getitem(self, index: int) -> tuple:
+        return self.grid_element(*self._process_single(self._source._getitem(index)))
+
+    @property
+    def _positions(self) -> int:
+        return self._source._positions
+
+    def _at(self, position: int) -> Optional[tuple]:
+        grid_element = self._source._at(position)
+        if grid_element is None:
+            return None
+        return self.grid_element(*self._process_single(grid_element))
+
+    def sample(self, rng: Optional[random.Random] = None) -> tuple:
+        return self.grid_element(*self._process_single(self._source.sample(rng or self.rng)))
 
     def _process_single(self, ge: tuple) -> list:
         element_list = []
@@ -263,7 +775,7 @@ class MapGrid(Grid):
         assert len(set(kwargs.keys())) == len(kwargs.keys()), "New columns must all have unique names"
         self.grid = grid
         self.dimension_mapping = kwargs
-        self.grid_element = namedtuple("GridElement", list(kwargs.keys()))  # type: ignore[misc]
+        self.grid_element = element_type(list(kwargs.keys()))
 
     def __repr__(self) -> str:
         mappings_str = ", ".join([f"{dim_name}={func.__name__}" for dim_name, func in self.dimension_mapping.items()])
@@ -272,12 +784,28 @@ class MapGrid(Grid):
     def __len__(self) -> int:
         return len(self.grid)
 
+    def estimate_len(self, samples: int = 1000) -> int:
+        return self.grid.estimate_len(samples)
+
     def __iter__(self) -> Iterator:
         for grid_element in self.grid:
             yield self.grid_element(**self._process_single(grid_element))
 
-    def sample(self) -> tuple:
-        return self.grid_element(**self._process_single(self.grid.sample()))
+    def _getitem(self, index: int) -> tuple:
+        return self.grid_element(**self._process_single(self.grid._getitem(index)))
+
+    @property
+    def _positions(self) -> int:
+        return self.grid._positions
+
+    def _at(self, position: int) -> Optional[tuple]:
+        grid_element = self.grid._at(position)
+        if grid_element is None:
+            return None
+        return self.grid_element(**self._process_single(grid_element))
+
+    def sample(self, rng: Optional[random.Random] = None) -> tuple:
+        return self.grid_element(**self._process_single(self.grid.sample(rng or self.rng)))
 
     def _process_single(self, ge: tuple) -> dict:
         return {dim_name: func(ge) for dim_name, func in self.dimension_mapping.items()}
@@ -289,7 +817,7 @@ class MapToGrid(Grid):
         assert set(grid.dimension_names).isdisjoint(set(kwargs.keys())), "New columns must not have name collisions with old columns"
         self.grid = grid
         self.dimension_mapping = kwargs
-        self.grid_element = namedtuple("GridElement", grid.dimension_names + list(kwargs.keys()))  # type: ignore[misc]
+        self.grid_element = element_type(grid.dimension_names + list(kwargs.keys()))
 
     def __repr__(self) -> str:
         mappings_str = ", ".join([f"{dim_name}={func.__name__}" for dim_name, func in self.dimension_mapping.items()])
@@ -298,13 +826,194 @@ class MapToGrid(Grid):
     def __len__(self) -> int:
         return len(self.grid)
 
+    def estimate_len(self, samples: int = 1000) -> int:
+        return self.grid.estimate_len(samples)
+
     def __iter__(self) -> Iterator:
         for grid_element in self.grid:
             yield self.grid_element(**self._process_single(grid_element))
 
-    def sample(self) -> tuple:
-        return self.grid_element(**self._process_single(self.grid.sample()))
+    def _getitem(self, index: int) -> tuple:
+        return self.grid_element(**self._process_single(self.grid._getitem(index)))
+
+    @property
+    def _positions(self) -> int:
+        return self.grid._positions
+
+    def _at(self, position: int) -> Optional[tuple]:
+        grid_element = self.grid._at(position)
+        if grid_element is None:
+            return None
+        return self.grid_element(**self._process_single(grid_element))
+
+    def sample(self, rng: Optional[random.Random] = None) -> tuple:
+        return self.grid_element(**self._process_single(self.grid.sample(rng or self.rng)))
 
     def _process_single(self, ge: tuple) -> dict:
         new_values = {dim_name: func(ge) for dim_name, func in self.dimension_mapping.items()}
         return ge._asdict() | new_values  # type: ignore
+
+
+class DistinctGrid(Grid):
+    """
+    The grid's elements with repeats dropped, keeping each first occurrence in iteration order.
+
+    Iteration holds only the seen-set: exact (optionally spilling to disk after `spill_after` keys) or a Bloom filter
+      sized for the parent's position count.  `len()` counts a full pass and is cached, and since a pass is deterministic it
+      matches iteration even for the Bloom filter's (rare) false positives.  Random access and sampling materialize the
+      distinct elements, as FilterGrid does.
+    """
+
+    _iter_cache: Optional[list] = None
+
+    def __init__(self, grid: Grid, method: DistinctMethod = "exact", spill_after: Optional[int] = None, error_rate: float = 1e-3) -> None:
+        assert method in ("exact", "bloom"), "Distinct method must be 'exact' or 'bloom'"
+        self.grid = grid
+        self.method = method
+        self.spill_after = spill_after
+        self.error_rate = error_rate
+        self.grid_element = grid.grid_element
+
+    def __repr__(self) -> str:
+        return f"DistinctGrid({repr(self.grid)}, {self.method!r})"
+
+    def __len__(self) -> int:
+        return self._len
+
+    @cached_property
+    def _len(self) -> int:
+        if self._iter_cache is not None:
+            return len(self._iter_cache)
+        return self._cached("len", lambda: sum(1 for _ in self))
+
+    def estimate_len(self, samples: int = 1000) -> int:
+        if "_len" in self.__dict__ or self._iter_cache is not None:
+            return len(self)
+        return self.grid.estimate_len(samples)
+
+    def __iter__(self) -> Iterator:
+        from hypergrid.dedup import seen_set
+        from hypergrid.plan import _has_stable_field_order
+
+        # Elements of a SumGrid may list the same fields in different orders, so compare them by name
+        key = None if _has_stable_field_order(self.grid) else operator.attrgetter(*self.dimension_names)
+        seen = seen_set(self.method, self.grid._positions, spill_after=self.spill_after, error_rate=self.error_rate)
+        try:
+            for grid_element in self.grid:
+                if seen.add(grid_element if key is None else key(grid_element)):
+                    yield grid_element
+        finally:
+            seen.close()
+
+    def _getitem(self, index: int) -> tuple:
+        return self._materialize()[index]
+
+    def sample(self, rng: Optional[random.Random] = None) -> tuple:
+        return (rng or self.rng or random).choice(self._materialize())
+
+    def _materialize(self) -> list:
+        if self._iter_cache is None:
+            self._iter_cache = self._cached("contents", lambda: [ge for ge in self])
+        return self._iter_cache
+
+    def _cached(self, kind: str, compute: Callable[[], Any]) -> Any:
+        # Bloom filters hash with hash(), which is salted per process for strings, so only exact results are shared
+        from hypergrid.cache import _disk_cached
+
+        return _disk_cached(self, kind, compute) if self.method == "exact" else compute()
+
+
+def _sum_leaves(grid: Grid) -> Iterator[Grid]:
+    stack = [grid]
+    while stack:
+        grid = stack.pop()
+        if type(grid) is SumGrid:
+            stack.extend([grid.grid2, grid.grid1])
+        else:
+            yield grid
+
+
+def _runs_no_functions(grid: Grid) -> bool:
+    """
+    Whether iterating the grid only combines dimension values, without calling any predicates or mapping functions.
+    """
+    match grid:
+        case HyperGrid():
+            return True
+        case ProductGrid() | SumGrid() | ZipGrid():
+            return _runs_no_functions(grid.grid1) and _runs_no_functions(grid.grid2)
+        case SelectGrid():
+            return _runs_no_functions(grid._source)
+        case _:
+            return False
+
+
+def _product(dimensions: list[Dimension]) -> Iterator[tuple]:
+    """
+    `itertools.product` over dimensions, except that dimensions longer than `_POOL_LIMIT` are streamed in chunks rather
+      than copied into a tuple up front, so iterating a grid with a huge (lazy) dimension takes bounded memory.  In
+      exchange, the last such dimension is re-iterated once per combination of the dimensions before it.
+    """
+    large = [i for i, dim in enumerate(dimensions) if len(dim) > _POOL_LIMIT]
+    if not large:
+        return itertools.product(*dimensions)
+    i = large[-1]
+    head, dim, tail = dimensions[:i], dimensions[i], dimensions[i + 1 :]
+    return itertools.chain.from_iterable(
+        itertools.product(*[(value,) for value in prefix], chunk, *tail) for prefix in _product(head) for chunk in _chunks(dim)
+    )
+
+
+def _chunks(iterable: Iterable) -> Iterator[tuple]:
+    iterator = iter(iterable)
+    return iter(lambda: tuple(itertools.islice(iterator, _CHUNK_SIZE)), ())
+
+
+def _push_filter_down(grid: Grid, predicate: Callable[[Any], bool], fields: frozenset[str]) -> Optional[Grid]:
+    """
+    Rewrite FilterGrid(grid, predicate) so the predicate runs as low in the tree as the fields it reads allow, or return
+      None if it can't be pushed below `grid`.  The rewritten grid yields the same elements in the same order.
+    """
+    match grid:
+        case HyperGrid():
+            names = grid.dimension_names
+            if not fields <= set(names):
+                return None
+            dim = grid.dimensions[names.index(next(iter(fields)))] if len(fields) == 1 else None
+            if dim is not None and len(dim) <= _POOL_LIMIT:
+                # Filter the values of the single dimension the predicate reads.  Larger (e.g. lazy) dimensions aren't
+                #   materialized, since sharding, sampling or resuming would then have to filter all of them up front
+                name = dim.name
+                single_element = element_type([name])
+                kept = Dimension(**{name: [v for v in dim if predicate(single_element(v))]})
+                return HyperGrid(*[kept if d is dim else d for d in grid.dimensions])
+            first = min(names.index(name) for name in fields)
+            last = max(names.index(name) for name in fields)
+            if last < len(names) - 1:
+                return ProductGrid(FilterGrid(HyperGrid(*grid.dimensions[: last + 1]), predicate), HyperGrid(*grid.dimensions[last + 1 :]))
+            if first > 0:
+                return ProductGrid(HyperGrid(*grid.dimensions[:first]), FilterGrid(HyperGrid(*grid.dimensions[first:]), predicate))
+            return None
+        case ProductGrid():
+            if fields <= set(grid.grid1.dimension_names):
+                return ProductGrid(FilterGrid(grid.grid1, predicate), grid.grid2)
+            if fields <= set(grid.grid2.dimension_names):
+                return ProductGrid(grid.grid1, FilterGrid(grid.grid2, predicate))
+            return None
+        case SumGrid():
+            pushed1 = _push_filter_down(grid.grid1, predicate, fields)
+            pushed2 = _push_filter_down(grid.grid2, predicate, fields)
+            if pushed1 is None and pushed2 is None:
+                return None
+            return SumGrid(
+                pushed1 if pushed1 is not None else FilterGrid(grid.grid1, predicate),
+                pushed2 if pushed2 is not None else FilterGrid(grid.grid2, predicate),
+            )
+        case MapToGrid() if type(grid) is MapToGrid and fields <= set(grid.grid.dimension_names):
+            # Filtering before the mapping also skips the mapping functions for rejected elements
+            return MapToGrid(FilterGrid(grid.grid, predicate), **grid.dimension_mapping)
+        case SelectGrid():
+            pushed = _push_filter_down(grid._source, predicate, fields)
+            return None if pushed is None else SelectGrid(pushed, *grid.select_dims)
+        case _:
+            return None
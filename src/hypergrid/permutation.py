@@ -0,0 +1,52 @@
+import random
+from typing import Iterator, Optional
+
+_MASK64 = (1 << 64) - 1
+
+
+class IndexPermutation:
+    """
+    A pseudo-random bijection over range(n) that is evaluated lazily in O(1) memory.
+
+    This is a balanced Feistel network over the smallest even bit-width domain covering n.  Outputs that land outside
+      range(n) are fed back through the network ("cycle walking") until they land inside it, which keeps it a bijection.
+      Round keys are drawn from `rng` (default: the global `random` module), so a seeded rng gives a reproducible order.
+    """
+
+    def __init__(self, n: int, rounds: int = 4, rng: Optional[random.Random] = None) -> None:
+        assert n >= 0, "Permutation size must be non-negative"
+        self.n = n
+        self.half_bits = max(1, ((n - 1).bit_length() + 1) // 2)
+        self.half_mask = (1 << self.half_bits) - 1
+        self.keys = [(rng or random).getrandbits(64) for _ in range(rounds)]
+
+    def __repr__(self) -> str:
+        return f"IndexPermutation({self.n})"
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __getitem__(self, index: int) -> int:
+        if not 0 <= index < self.n:
+            raise IndexError("Permutation index out of range")
+        value = self._encrypt(index)
+        while value >= self.n:
+            value = self._encrypt(value)
+        return value
+
+    def __iter__(self) -> Iterator[int]:
+        for index in range(self.n):
+            yield self[index]
+
+    def _encrypt(self, value: int) -> int:
+        left, right = value >> self.half_bits, value & self.half_mask
+        for key in self.keys:
+            left, right = right, left ^ self._round(right, key)
+        return (left << self.half_bits) | right
+
+    def _round(self, value: int, key: int) -> int:
+        # splitmix64 finalizer, keyed by the round key
+        value = (value + key) & _MASK64
+        value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+        value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK64
+        return (value ^ (value >> 31)) & self.half_mask
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import operator
+import random
+from enum import Enum
+from typing import Any, Callable, Iterator, Optional
+
+from hypergrid.dimension import Dimension
+from hypergrid.grid import DistinctGrid, FilterGrid, Grid, HyperGrid, MapGrid, MapToGrid, ProductGrid, SelectGrid, SumGrid, _product
+
+
+class StageKind(Enum):
+    FILTER = "filter"
+    SELECT = "select"
+    MAP = "map"
+    MAP_TO = "map_to"
+
+
+Stage = tuple[StageKind, Any, type[tuple]]
+
+
+class CompiledGrid(Grid):
+    """
+    Iterates a chain of FilterGrid, SelectGrid, MapGrid and MapToGrid layers over a source grid in one loop.
+
+    Intermediate values are carried as plain tuples and selections are applied by position.  A namedtuple is only built
+      when a user function needs to read one, and once more for the final grid element.  Cartesian sources (HyperGrids
+      and products of HyperGrids) are read straight from `itertools.product` over their dimensions.
+
+    With `as_tuples=True`, iteration skips the final grid element and yields the plain value tuples, for hot loops that
+      only need positional access.  Everything other than `__iter__` is delegated to the original grid.
+    """
+
+    def __init__(self, grid: Grid, as_tuples: bool = False) -> None:
+        self.grid = grid
+        self.as_tuples = as_tuples
+        self.grid_element = grid.grid_element
+        self.source, self.stages = _plan(grid)
+
+    def __repr__(self) -> str:
+        return f"CompiledGrid({repr(self.grid)})"
+
+    def __len__(self) -> int:
+        return len(self.grid)
+
+    def __iter__(self) -> Iterator:
+        make_final = None if self.as_tuples else self.grid_element._make  # type: ignore[attr-defined]
+        stages = self.stages
+        for values in self._iter_source():
+            element = None
+            for kind, payload, element_type in stages:
+                if kind is StageKind.FILTER:
+                    if element is None:
+                        element = element_type._make(values)  # type: ignore[attr-defined]
+                    if not payload(element):
+                        break
+                elif kind is StageKind.SELECT:
+                    values = payload(values)
+                    element = None
+                else:
+                    if element is None:
+                        element = element_type._make(values)  # type: ignore[attr-defined]
+                    mapped = tuple([func(element) for func in payload])
+                    values = values + mapped if kind is StageKind.MAP_TO else mapped
+                    element = None
+            else:
+                if make_final is None:
+                    yield values
+                elif element is not None:
+                    yield element
+                else:
+                    yield make_final(values)
+
+    def _iter_source(self) -> Iterator[tuple]:
+        dimensions = _cartesian_dimensions(self.source)
+        if dimensions is not None:
+            return _product(dimensions)
+        if _has_stable_field_order(self.source):
+            return iter(self.source)
+        # A SumGrid may yield elements whose fields are ordered differently, so normalize them by name
+        return map(operator.attrgetter(*self.source.dimension_names), self.source)
+
+    def _getitem(self, index: int) -> tuple:
+        return self.grid._getitem(index)
+
+    @property
+    def _positions(self) -> int:
+        return self.grid._positions
+
+    def _at(self, position: int) -> Optional[tuple]:
+        return self.grid._at(position)
+
+    def sample(self, rng: Optional[random.Random] = None) -> tuple:
+        return self.grid.sample(rng)
+
+
+def _plan(grid: Grid) -> tuple[Grid, list[Stage]]:
+    """
+    Peel unary layers off the top of the tree, returning the source grid and the stages to apply to it, in order.
+
+    Subclasses of the unary grids (e.g. the batch grids) may override iteration, so only the exact types are fused.
+    """
+    stages: list[Stage] = []
+    while True:
+        match grid:
+            case FilterGrid() if type(grid) is FilterGrid and grid._pushed_down is not None:
+                grid = grid._pushed_down
+            case FilterGrid() if type(grid) is FilterGrid:
+                stages.append((StageKind.FILTER, grid.predicate, grid.grid.grid_element))
+                grid = grid.grid
+            case SelectGrid() if type(grid) is SelectGrid:
+                positions = [grid._source.dimension_names.index(name) for name in grid.dimension_names]
+                stages.append((StageKind.SELECT, _selector(positions), grid._source.grid_element))
+                grid = grid._source
+            case MapGrid() if type(grid) is MapGrid:
+                stages.append((StageKind.MAP, list(grid.dimension_mapping.values()), grid.grid.grid_element))
+                grid = grid.grid
+            case MapToGrid() if type(grid) is MapToGrid:
+                stages.append((StageKind.MAP_TO, list(grid.dimension_mapping.values()), grid.grid.grid_element))
+                grid = grid.grid
+            case _:
+                return grid, stages[::-1]
+
+
+def _selector(positions: list[int]) -> Callable[[tuple], tuple]:
+    if len(positions) == 1:
+        position = positions[0]
+        return lambda values: (values[position],)
+    return operator.itemgetter(*positions)
+
+
+def _cartesian_dimensions(grid: Grid) -> Optional[list[Dimension]]:
+    match grid:
+        case HyperGrid():
+            return grid.dimensions
+        case ProductGrid():
+            dimensions1 = _cartesian_dimensions(grid.grid1)
+            dimensions2 = _cartesian_dimensions(grid.grid2)
+            if dimensions1 is None or dimensions2 is None:
+                return None
+            return dimensions1 + dimensions2
+        case _:
+            return None
+
+
+def _has_stable_field_order(grid: Grid) -> bool:
+    """
+    Whether every element the grid yields has its fields in `dimension_names` order.  Only SumGrid (and FilterGrids or
+      DistinctGrids passing its elements through) can break this, when its sub-grids declare the same fields in different orders.
+    """
+    match grid:
+        case SumGrid():
+            return (
+                grid.grid1.dimension_names == grid.grid2.dimension_names
+                and _has_stable_field_order(grid.grid1)
+                and _has_stable_field_order(grid.grid2)
+            )
+        case FilterGrid() | DistinctGrid():
+            return _has_stable_field_order(grid.grid)
+        case _:
+            return True
@@ -0,0 +1,229 @@
+import sys
+import time
+import timeit
+from contextlib import contextmanager
+from functools import update_wrapper
+from typing import Any, Callable, Iterator, Optional
+
+from hypergrid.grid import DistinctGrid, FilterGrid, Grid, MapGrid, MapToGrid, SelectGrid, SumGrid
+from hypergrid.plan import CompiledGrid, _plan
+
+
+class FunctionStats:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.seconds = 0.0
+
+    def __repr__(self) -> str:
+        return f"FunctionStats(calls={self.calls}, seconds={self.seconds:.6f})"
+
+
+class NodeStats:
+    """
+    What one grid node did while profiled.  `seconds` includes the time spent in the nodes it iterates; `self_seconds`
+      excludes it.  `rejected` counts elements its predicate rejected (FilterGrids only), `functions` the calls to its
+      map/map_to functions, and `cache_bytes` the size of its materialized `_iter_cache`, if any.
+
+    `construction_seconds` estimates time spent building its grid elements, from the cost of building one element.
+    """
+
+    def __init__(self, label: str, depth: int) -> None:
+        self.label = label
+        self.depth = depth
+        self.produced = 0
+        self.seconds = 0.0
+        self.self_seconds = 0.0
+        self.rejected = 0
+        self.predicate = FunctionStats()
+        self.functions: dict[str, FunctionStats] = {}
+        self.cache_bytes = 0
+        self.construction_seconds = 0.0
+        self._last: Optional[tuple] = None
+
+    def __repr__(self) -> str:
+        return f"NodeStats({self.label}, produced={self.produced}, seconds={self.seconds:.6f})"
+
+
+class Profile:
+    """
+    Per-node statistics collected by `profile()`, in the order nodes were first iterated.  `str(p)` is a table.
+    """
+
+    def __init__(self) -> None:
+        self.nodes: dict[int, NodeStats] = {}
+        self._grids: dict[int, Grid] = {}
+        # [stats, time spent in nested nodes] for each node currently producing an element
+        self._stack: list[list] = []
+        self._restore: list[tuple[Any, str, Any]] = []
+
+    def __repr__(self) -> str:
+        return f"Profile({len(self.nodes)} nodes)"
+
+    def __str__(self) -> str:
+        header = f"{'node':<48} {'produced':>10} {'rejected':>10} {'seconds':>10} {'self':>10} {'build':>10} {'cache':>10}"
+        lines = [header]
+        for stats in self.nodes.values():
+            lines.append(
+                f"{'  ' * stats.depth + stats.label:<48.48} {stats.produced:>10} {stats.rejected:>10} {stats.seconds:>10.4f} "
+                f"{stats.self_seconds:>10.4f} {stats.construction_seconds:>10.4f} {stats.cache_bytes:>10}"
+            )
+            if stats.predicate.calls:
+                lines.append(f"{'  ' * (stats.depth + 1) + 'predicate':<48.48} {stats.predicate.calls:>10} {'':>10} {stats.predicate.seconds:>10.4f}")
+            for name, func in stats.functions.items():
+                lines.append(f"{'  ' * (stats.depth + 1) + name:<48.48} {func.calls:>10} {'':>10} {func.seconds:>10.4f}")
+        return "\n".join(lines)
+
+    def _instrument(self, grid: Grid, depth: int = 0) -> None:
+        """
+        Register the grid and its descendants, wrapping their predicates and map functions with timers until the profile
+          ends.  CompiledGrids are re-planned so that their fused loops call the wrapped functions.
+        """
+        if id(grid) in self.nodes:
+            return
+        stats = self.nodes[id(grid)] = NodeStats(_label(grid), depth)
+        self._grids[id(grid)] = grid
+        match grid:
+            case FilterGrid():
+                # Wrappers hide the bytecode that pushdown inspects, so settle pushdown first
+                grid._pushed_down
+                self._replace(grid, "predicate", _Timed(grid.predicate, stats.predicate, stats))
+            case MapGrid() | MapToGrid():
+                wrapped = {name: _Timed(func, stats.functions.setdefault(name, FunctionStats())) for name, func in grid.dimension_mapping.items()}
+                self._replace(grid, "dimension_mapping", wrapped)
+            case SelectGrid():
+                grid._source
+        for child in _children(grid):
+            self._instrument(child, depth + 1)
+        if isinstance(grid, CompiledGrid):
+            self._replace(grid, "stages", _plan(grid.grid)[1])
+
+    def _replace(self, obj: Any, name: str, value: Any) -> None:
+        self._restore.append((obj, name, obj.__dict__[name]))
+        obj.__dict__[name] = value
+
+    def _timed(self, stats: NodeStats, iterator: Iterator) -> Iterator:
+        stack = self._stack
+        while True:
+            frame: list[Any] = [stats, 0.0]
+            stack.append(frame)
+            start = time.perf_counter()
+            try:
+                element = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                elapsed = time.perf_counter() - start
+                stack.pop()
+                stats.seconds += elapsed
+                stats.self_seconds += elapsed - frame[1]
+                if stack:
+                    stack[-1][1] += elapsed
+            stats.produced += 1
+            stats._last = element
+            yield element
+
+    def _finish(self) -> None:
+        for obj, name, original in reversed(self._restore):
+            obj.__dict__[name] = original
+        self._restore.clear()
+        for node_id, stats in self.nodes.items():
+            grid = self._grids[node_id]
+            cache = getattr(grid, "_iter_cache", None)
+            if cache is not None:
+                stats.cache_bytes = sys.getsizeof(cache) + sum(sys.getsizeof(ge) for ge in cache)
+            # Filters, sums and distinct grids pass their inputs' elements through rather than building new ones
+            if stats._last is not None and hasattr(stats._last, "_make") and not isinstance(grid, (FilterGrid, SumGrid, DistinctGrid)):
+                values, make = tuple(stats._last), stats._last._make
+                stats.construction_seconds = stats.produced * timeit.timeit(lambda: make(values), number=1000) / 1000
+        self._grids.clear()
+
+
+class _Timed:
+    """
+    A grid function wrapped to count and time its calls, and (for predicates) the elements it rejects.
+    """
+
+    def __init__(self, func: Callable[[Any], Any], stats: FunctionStats, rejections: Optional[NodeStats] = None) -> None:
+        self.func = func
+        self.stats = stats
+        self.rejections = rejections
+        update_wrapper(self, func)
+
+    def __call__(self, ge: tuple) -> Any:
+        start = time.perf_counter()
+        result = self.func(ge)
+        self.stats.seconds += time.perf_counter() - start
+        self.stats.calls += 1
+        if self.rejections is not None and not result:
+            self.rejections.rejected += 1
+        return result
+
+
+@contextmanager
+def profile() -> Iterator[Profile]:
+    """
+    `with hypergrid.profile() as p: list(grid)`, then `print(p)` for per-node element counts, inclusive and self times,
+      filter rejections, time in each predicate and map function, estimated element construction time and the size of
+      materialized filter caches.
+
+    Profiling swaps in timed `__iter__` methods on the grid classes for the duration of the block, and restores the
+      originals afterwards, so it costs nothing when off.  Only iteration is timed (not indexing or sampling), and it
+      isn't thread-safe: profile one pipeline at a time.
+    """
+    result = Profile()
+    patched: list[tuple[type, Callable]] = []
+    for cls in _grid_classes():
+        if "__iter__" in cls.__dict__:
+            patched.append((cls, cls.__dict__["__iter__"]))
+            setattr(cls, "__iter__", _profiled_iter(result, cls.__dict__["__iter__"]))
+    try:
+        yield result
+    finally:
+        for cls, original in patched:
+            setattr(cls, "__iter__", original)
+        result._finish()
+
+
+def _profiled_iter(result: Profile, original: Callable[[Grid], Iterator]) -> Callable[[Grid], Iterator]:
+    def __iter__(self: Grid) -> Iterator:
+        # A subclass calling its base class's __iter__ is the same node
+        if result._stack and result._stack[-1][0] is result.nodes.get(id(self)):
+            return original(self)
+        result._instrument(self)
+        return result._timed(result.nodes[id(self)], original(self))
+
+    return __iter__
+
+
+def _grid_classes() -> list[type]:
+    classes: list[type] = []
+    pending = list(Grid.__subclasses__())
+    while pending:
+        cls = pending.pop()
+        if cls not in classes:
+            classes.append(cls)
+            pending.extend(cls.__subclasses__())
+    return classes
+
+
+def _children(grid: Grid) -> list[Grid]:
+    children = [getattr(grid, name) for name in ("grid", "grid1", "grid2") if isinstance(getattr(grid, name, None), Grid)]
+    match grid:
+        case FilterGrid() if grid._pushed_down is not None:
+            children.append(grid._pushed_down)
+        case SelectGrid() if grid._source is not grid.grid:
+            children.append(grid._source)
+    return children
+
+
+def _label(grid: Grid) -> str:
+    match grid:
+        case FilterGrid():
+            details = getattr(grid.predicate, "__name__", repr(grid.predicate))
+        case MapGrid() | MapToGrid():
+            details = ", ".join(grid.dimension_mapping)
+        case DistinctGrid():
+            details = grid.method
+        case _:
+            details = ", ".join(grid.dimension_names)
+    return f"{type(grid).__name__}({details})"
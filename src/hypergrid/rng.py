@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import hashlib
+import random
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def stream(seed: int, index: int) -> random.Random:
+    """
+    The `index`-th independent random stream derived from `seed`, e.g. `grid.sample(rng=stream(seed, worker_index))`.
+
+    Each worker can derive its own stream without coordinating with the others.  Child seeds are a SHA-256 hash of the
+      parent seed and index, so streams are reproducible across processes and machines (unlike `hash()`), and don't
+      depend on whether NumPy is installed.
+    """
+    assert index >= 0, "Stream index must be non-negative"
+    digest = hashlib.sha256(f"hypergrid:{seed}:{index}".encode()).digest()
+    return random.Random(int.from_bytes(digest, "big"))
+
+
+def spawn(seed: int, count: int) -> list[random.Random]:
+    """
+    `count` independent random streams derived from `seed`, one per worker.
+    """
+    return [stream(seed, index) for index in range(count)]
+
+
+def generator(seed: int, index: int) -> np.random.Generator:
+    """
+    The `index`-th independent NumPy Generator derived from `seed`, for batch draws such as `Distribution.sample_batch`.
+      This is the same stream as `numpy.random.SeedSequence(seed).spawn(index + 1)[index]`.  Requires hypergrid[numpy].
+    """
+    from hypergrid.ext.numpy import _spawned_generator
+
+    return _spawned_generator(seed, index)
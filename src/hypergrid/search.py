@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import math
+import multiprocessing
+import os
+import random
+from collections import namedtuple
+from contextlib import contextmanager
+from functools import partial
+from itertools import islice, repeat
+from multiprocessing.context import BaseContext
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional
+
+from hypergrid.execution import ExecutorKind, _evaluate_element, _evaluate_grid_position, _evaluate_position, _inherits_grid, _make_executor
+from hypergrid.permutation import IndexPermutation
+
+if TYPE_CHECKING:
+    from hypergrid.grid import Grid
+
+Trial = namedtuple("Trial", ["element", "budget", "score"])
+SearchResult = namedtuple("SearchResult", ["best", "score", "trials"])
+
+# Called as `objective(grid_element, budget)`, returning a score
+Objective = Callable[[Any, Any], float]
+
+
+def successive_halving(
+    grid: Grid,
+    objective: Objective,
+    budget: float,
+    eta: int = 3,
+    min_budget: float = 1,
+    n: Optional[int] = None,
+    maximize: bool = False,
+    executor: ExecutorKind = "process",
+    workers: Optional[int] = None,
+    rng: Optional[random.Random] = None,
+    mp_context: Optional[BaseContext] = None,
+) -> SearchResult:
+    """
+    Successive halving: evaluate `n` distinct grid elements at `min_budget`, keep the best 1/eta of them, evaluate those
+      at eta times the budget, and so on until the survivors are evaluated at the full `budget`.
+
+    `n` defaults to enough candidates for one to survive to the full budget.  Integer budgets are rounded so the
+      objective always receives ints (e.g. epochs).  Candidates are drawn without replacement through the grid's position
+      space, and each round is evaluated in a process or thread pool as in `Grid.run` (including its `mp_context`).  Lower
+      scores win unless `maximize`.
+    """
+    rungs = _rungs(budget, min_budget, eta)
+    with _evaluator(grid, objective, executor, workers, mp_context) as evaluate:
+        positions = _sample_positions(grid, n or eta**rungs, rng or grid.rng)
+        trials = _halve(evaluate, positions, rungs, budget, eta, maximize)
+    return _result(grid, trials, maximize)
+
+
+def hyperband(
+    grid: Grid,
+    objective: Objective,
+    budget: float,
+    eta: int = 3,
+    min_budget: float = 1,
+    maximize: bool = False,
+    executor: ExecutorKind = "process",
+    workers: Optional[int] = None,
+    rng: Optional[random.Random] = None,
+    mp_context: Optional[BaseContext] = None,
+) -> SearchResult:
+    """
+    Hyperband: successive halving over several brackets, from many candidates started at `min_budget` to a few started
+      at the full `budget`, hedging against objectives whose early scores don't predict their final ones.
+    """
+    max_rungs = _rungs(budget, min_budget, eta)
+    rng = rng or grid.rng
+    trials: list[tuple] = []
+    with _evaluator(grid, objective, executor, workers, mp_context) as evaluate:
+        for rungs in range(max_rungs, -1, -1):
+            n = math.ceil((max_rungs + 1) / (rungs + 1) * eta**rungs)
+            trials += _halve(evaluate, _sample_positions(grid, n, rng), rungs, budget, eta, maximize)
+    return _result(grid, trials, maximize)
+
+
+def _rungs(budget: float, min_budget: float, eta: int) -> int:
+    """
+    The number of times `min_budget` can be multiplied by eta without exceeding `budget`.
+    """
+    assert eta >= 2, "eta must be at least 2"
+    assert 0 < min_budget <= budget, "Budgets must satisfy 0 < min_budget <= budget"
+    rungs = 0
+    while min_budget * eta ** (rungs + 1) <= budget * (1 + 1e-9):
+        rungs += 1
+    return rungs
+
+
+def _halve(evaluate: Callable[[list[int], Any], list], positions: list[int], rungs: int, budget: float, eta: int, maximize: bool) -> list[tuple]:
+    trials: list[tuple] = []
+    for rung in range(rungs, -1, -1):
+        rung_budget = _rung_budget(budget, eta, rung)
+        scores = evaluate(positions, rung_budget)
+        trials += zip(positions, repeat(rung_budget), scores)
+        if rung > 0:
+            ranked = sorted(range(len(positions)), key=lambda i: _sort_key(scores[i], maximize))
+            positions = [positions[i] for i in ranked[: max(1, len(positions) // eta)]]
+    return trials
+
+
+def _rung_budget(budget: float, eta: int, rung: int) -> float:
+    value = budget / eta**rung
+    return max(1, round(value)) if isinstance(budget, int) else value
+
+
+def _sort_key(score: float, maximize: bool) -> tuple[bool, float]:
+    # NaN scores (e.g. a diverged run) always rank last
+    return (math.isnan(score), -score if maximize else score)
+
+
+def _sample_positions(grid: Grid, n: int, rng: Optional[random.Random]) -> list[int]:
+    """
+    Up to `n` distinct positions holding grid elements, in random order.  Fewer are returned if the grid is smaller.
+    """
+    assert n > 0, "Number of candidates must be positive"
+    permutation = IndexPermutation(grid._positions, rng=rng)
+    positions = list(islice((position for position in permutation if grid._at(position) is not None), n))
+    if not positions:
+        raise ValueError("Cannot search an empty grid")
+    return positions
+
+
+@contextmanager
+def _evaluator(
+    grid: Grid, objective: Objective, executor: ExecutorKind, workers: Optional[int], mp_context: Optional[BaseContext]
+) -> Iterator[Callable[[list[int], Any], list]]:
+    """
+    A pool that evaluates the objective at a list of grid positions and one budget, kept open across rounds so that
+      process workers are only started once.  As in `Grid.run`, forked workers rebuild elements from their positions and
+      other workers are sent the elements.
+    """
+    workers = workers or os.cpu_count() or 1
+    context = mp_context or multiprocessing.get_context()
+    pool = _make_executor(grid, objective, executor, workers, context)
+    by_position = executor == "thread" or _inherits_grid(context)
+    task: Callable[[Any, Any], Any]
+    if executor == "thread":
+        task = partial(_evaluate_grid_position, grid, objective)
+    else:
+        task = _evaluate_position if by_position else _evaluate_element
+
+    def evaluate(positions: list[int], budget: Any) -> list:
+        args = positions if by_position else [grid._at(position) for position in positions]
+        return list(pool.map(task, args, repeat(budget), chunksize=max(1, len(positions) // (4 * workers))))
+
+    try:
+        yield evaluate
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _result(grid: Grid, trials: list[tuple], maximize: bool) -> SearchResult:
+    elements = {position: grid._at(position) for position in {position for position, _, _ in trials}}
+    results = [Trial(elements[position], budget, score) for position, budget, score in trials]
+    # The best element is the best score at the largest budget any element reached
+    top_budget = max(trial.budget for trial in results)
+    best = min((trial for trial in results if trial.budget == top_budget), key=lambda trial: _sort_key(trial.score, maximize))
+    return SearchResult(best.element, best.score, results)
@@ -1,5 +1,62 @@
-from typing import Callable
+import types
+from typing import Any, Callable, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
 
 
 def instantiate_lambda(cls: type) -> Callable:
     return lambda ge: cls(**ge._asdict())
+
+
+def depends_on(*fields: str) -> Callable[[F], F]:
+    """
+    Declare which grid element fields a predicate or mapping function reads.  This lets FilterGrid push the predicate
+      down to the sub-grid or dimension that owns those fields.
+    """
+
+    def decorator(func: F) -> F:
+        func.__hypergrid_depends_on__ = frozenset(fields)  # type: ignore[attr-defined]
+        return func
+
+    return decorator
+
+
+def dependencies(func: Callable) -> Optional[frozenset[str]]:
+    """
+    The fields a function reads from its grid element argument, either declared with `depends_on` or inferred from its
+      bytecode.  Returns None if the fields can't be determined.
+    """
+    declared = getattr(func, "__hypergrid_depends_on__", None)
+    if declared is not None:
+        return declared
+    return _infer_dependencies(func)
+
+
+def _infer_dependencies(func: Callable) -> Optional[frozenset[str]]:
+    """
+    Conservative inference: succeeds only if every use of the element argument is an immediate attribute access, as in
+      `lambda ge: ge.lr * ge.bs < 1e3`.  Anything else (passing the element on, indexing it, closing over it) gives up.
+    """
+    code = getattr(func, "__code__", None)
+    # A bound method's first argument is its instance, so the element is the one after it
+    position = 1 if isinstance(func, types.MethodType) else 0
+    if code is None or code.co_argcount <= position:
+        return None
+    arg_name = code.co_varnames[position]
+    if arg_name in code.co_cellvars:
+        return None
+    import dis
+
+    instructions = list(dis.get_instructions(code))
+    fields = set()
+    for instruction, following in zip(instructions, instructions[1:] + [None]):
+        if not instruction.opname.startswith(("LOAD_FAST", "STORE_FAST", "DELETE_FAST")):
+            continue
+        argval = instruction.argval
+        if arg_name not in (argval if isinstance(argval, tuple) else (argval,)):
+            continue
+        if instruction.opname.startswith("LOAD_FAST") and argval == arg_name and following is not None and following.opname == "LOAD_ATTR":
+            fields.add(following.argval)
+        else:
+            return None
+    return frozenset(fields)
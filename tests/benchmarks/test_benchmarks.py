@@ -0,0 +1,135 @@
+"""
+Throughput and peak memory for the grid hot paths, at sizes from 10^3 to 10^7 elements.
+
+These are marked slow, so they're deselected by default; run them with `pytest tests/benchmarks -m slow -s`.  Each
+  benchmark prints (and records as junit properties) its time, elements/sec and peak traced memory.  Streaming paths
+  assert that peak memory doesn't grow with the grid, which is machine-independent; raw throughput is reported only.
+"""
+
+import operator
+import os
+import time
+import tracemalloc
+from collections import deque
+from functools import reduce
+from typing import Any, Callable
+
+import pytest
+
+from hypergrid.grid import Grid, HyperGrid
+
+pytestmark = pytest.mark.slow
+
+SIZES = [int(size) for size in os.environ.get("HYPERGRID_BENCHMARK_SIZES", "1000,100000,10000000").split(",")]
+SAMPLES = 10**4
+# Streaming a grid should hold a bounded amount of memory no matter how many elements pass through.  Dimensions up to
+#   hypergrid.grid._POOL_LIMIT values (and all of sklearn's) are pooled by itertools.product, so the bound is per dimension
+STREAMING_PEAK_BYTES = 16 * 2**20
+
+
+def _hypergrid(n: int) -> Grid:
+    return HyperGrid(x=range(10), y=range(10), z=range(n // 100))
+
+
+def _deep_product(n: int) -> Grid:
+    digits = len(str(n)) - 1
+    return reduce(operator.mul, [HyperGrid(**{f"d{i}": range(10)}) for i in range(digits)])
+
+
+def _deep_sum(n: int) -> Grid:
+    return reduce(operator.add, [HyperGrid(x=range(i * n // 100, (i + 1) * n // 100), y=["a"]) for i in range(100)])
+
+
+def _chain(n: int) -> Grid:
+    g = _hypergrid(n).filter(lambda ge: ge.x % 2 == 0).map_to(w=lambda ge: ge.y * ge.z)
+    return g.filter(lambda ge: ge.w % 3 != 0).select("x", "w")
+
+
+GRIDS: dict[str, Callable[[int], Grid]] = {
+    "hypergrid": _hypergrid,
+    "deep_product": _deep_product,
+    "deep_sum": _deep_sum,
+    "filter_map_chain": _chain,
+}
+
+SAMPLED_GRIDS: dict[str, Callable[[int], Grid]] = {
+    "hypergrid": _hypergrid,
+    "sum": _deep_sum,
+    "product": _deep_product,
+    "zip": lambda n: HyperGrid(x=range(n)) & HyperGrid(y=range(n)),
+    "filter": lambda n: _hypergrid(n).filter(lambda ge: ge.x % 2 == 0),
+    "select": lambda n: _hypergrid(n).select("x", "z"),
+    "map": lambda n: _hypergrid(n).map(w=lambda ge: ge.x + ge.z),
+    "map_to": lambda n: _hypergrid(n).map_to(w=lambda ge: ge.x + ge.z),
+}
+
+
+def _benchmark(record_property: Callable[[str, Any], None], name: str, func: Callable[[], Any], elements: int) -> int:
+    """
+    Time `func` once, then run it again under tracemalloc for its peak memory (tracing slows it down too much to time).
+    """
+    start = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    rate = elements / seconds if seconds > 0 else float("inf")
+    record_property(f"{name}_seconds", seconds)
+    record_property(f"{name}_elements_per_second", rate)
+    record_property(f"{name}_peak_bytes", peak)
+    print(f"{name}: {seconds:.4f}s, {rate:,.0f} elements/s, peak {peak / 2**20:.2f} MiB")
+    return peak
+
+
+def _consume(grid: Grid) -> None:
+    deque(grid, maxlen=0)
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("kind", GRIDS)
+def test_construction(record_property, kind, size):
+    _benchmark(record_property, f"construct_{kind}_{size}", lambda: GRIDS[kind](size), 1)
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("kind", GRIDS)
+def test_iteration(record_property, kind, size):
+    grid = GRIDS[kind](size)
+    peak = _benchmark(record_property, f"iter_{kind}_{size}", lambda: _consume(grid), len(grid))
+    assert peak < STREAMING_PEAK_BYTES
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("kind", GRIDS)
+def test_compiled_iteration(record_property, kind, size):
+    grid = GRIDS[kind](size)
+    peak = _benchmark(record_property, f"compiled_{kind}_{size}", lambda: _consume(grid.compile()), len(grid))
+    assert peak < STREAMING_PEAK_BYTES
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("kind", SAMPLED_GRIDS)
+def test_sample(record_property, kind, size):
+    grid = SAMPLED_GRIDS[kind](size)
+    grid.sample()
+    peak = _benchmark(record_property, f"sample_{kind}_{size}", lambda: [grid.sample() for _ in range(SAMPLES)], SAMPLES)
+    assert peak < STREAMING_PEAK_BYTES
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_filtered_len(record_property, size):
+    # A fresh grid per run, since FilterGrid caches its length
+    peak = _benchmark(record_property, f"filtered_len_{size}", lambda: len(_chain(size)), size)
+    assert peak < STREAMING_PEAK_BYTES
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_to_sklearn(record_property, size):
+    pytest.importorskip("sklearn")
+    grid = (_hypergrid(size) + _hypergrid(size)) * HyperGrid(w=[0.1, 0.2])
+    peak = _benchmark(record_property, f"to_sklearn_{size}", lambda: list(zip(range(SAMPLES), grid.to_sklearn())), SAMPLES)
+    assert peak < STREAMING_PEAK_BYTES
@@ -0,0 +1,33 @@
+"""
+Interpreter startup cost of importing hypergrid, which every short-lived worker process pays.  Marked slow like the other
+  benchmarks; run with `pytest tests/benchmarks -m slow -s`.
+"""
+
+import subprocess
+import sys
+import time
+
+import pytest
+
+pytestmark = pytest.mark.slow
+
+RUNS = 20
+# Allowed time on top of a bare interpreter, which `import hypergrid.dsl` should stay far below
+IMPORT_BUDGET_SECONDS = {"import hypergrid.dsl": 0.02, "from hypergrid.dsl import *": 0.1}
+
+
+def _best_time(statement: str) -> float:
+    times = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+@pytest.mark.parametrize("statement", IMPORT_BUDGET_SECONDS)
+def test_import_time(record_property, statement):
+    overhead = _best_time(statement) - _best_time("pass")
+    record_property("import_seconds", overhead)
+    print(f"{statement}: {overhead * 1000:.1f}ms over a bare interpreter")
+    assert overhead < IMPORT_BUDGET_SECONDS[statement]
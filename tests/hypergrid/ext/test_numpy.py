@@ -0,0 +1,81 @@
+import numpy as np
+
+from hypergrid.dsl import HyperGrid
+
+
+def _assert_columns_match(columns, grid):
+    elements = list(grid)
+    assert list(columns.keys()) == grid.dimension_names
+    for name, column in columns.items():
+        assert len(column) == len(elements)
+        assert list(column) == [getattr(ge, name) for ge in elements]
+
+
+def test_hypergrid_columns():
+    g = HyperGrid(example=[1, 2, 3], example2=[0.5, 1.5], example3=["a", "b"], example4=range(3))
+    columns = g.to_columns()
+    _assert_columns_match(columns, g)
+    assert columns["example"].dtype == np.int64
+    assert columns["example2"].dtype == np.float64
+    assert columns["example3"].dtype.kind == "U"
+
+
+def test_composed_columns():
+    g = HyperGrid(example=[1, 2, 3]) + HyperGrid(example=["a", "b"])
+    g = (g * HyperGrid(example2=[None, (1, 2)])) & HyperGrid(example3=range(100))
+    g = g.select("example", "example2")
+    _assert_columns_match(g.to_columns(), g)
+    assert g.to_columns()["example"].dtype == object
+
+
+def test_iter_batches():
+    g = HyperGrid(example=range(10), example2=range(7))
+    batches = list(g.iter_batches(batch_size=8))
+    assert [len(b["example"]) for b in batches] == [8] * 8 + [6]
+    _assert_columns_match({name: np.concatenate([b[name] for b in batches]) for name in g.dimension_names}, g)
+
+    fg = g.filter(lambda ge: ge.example > ge.example2).map_to(example3=lambda ge: ge.example - ge.example2)
+    batches = list(fg.iter_batches(batch_size=8))
+    _assert_columns_match({name: np.concatenate([b[name] for b in batches]) for name in fg.dimension_names}, fg)
+
+
+def test_batch_filter_and_maps():
+    g = HyperGrid(lr=[0.1, 1.0, 10.0], bs=[16, 64, 256], opt=["sgd", "adam"])
+    fg = g.filter_batch(lambda cols: cols["lr"] * cols["bs"] < 100)
+    assert list(fg) == list(g.filter(lambda ge: ge.lr * ge.bs < 100))
+    assert len(fg) == 10
+    assert all(ge.lr * ge.bs < 100 for ge in (fg.sample() for _ in range(20)))
+
+    mg = fg.map_to_batch(prod=lambda cols: cols["lr"] * cols["bs"], const=lambda cols: 1)
+    expected = [ge._asdict() | {"prod": ge.lr * ge.bs, "const": 1} for ge in fg]
+    assert [ge._asdict() for ge in mg] == expected
+    assert [mg[i]._asdict() for i in range(len(mg))] == expected
+    _assert_columns_match(mg.to_columns(), mg)
+
+    mg = g.map_batch(tag=lambda cols: np.char.add(cols["opt"], "-tag"))
+    assert [ge.tag for ge in mg] == [f"{ge.opt}-tag" for ge in g]
+    for count in [1, 4]:
+        assert [ge for k in range(count) for ge in mg.select("tag").shard(k, count)] == list(mg.select("tag"))
+
+
+def test_batch_grids_preserve_values():
+    g = HyperGrid(x=[1, 2.5, 3, 2**60 + 1])
+    fg = g.filter_batch(lambda cols: cols["x"] > 0)
+    assert list(fg) == list(g)
+    assert [type(ge.x) for ge in fg] == [int, float, int, int]
+    assert fg.to_columns()["x"].tolist() == [1, 2.5, 3, 2**60 + 1]
+
+    mg = g.map_batch(y=lambda cols: cols["x"] * 2)
+    assert [ge.y for ge in mg] == [2, 5.0, 6, 2**61 + 2]
+    assert [mg[i] for i in range(len(mg))] == list(mg)
+    assert [type(ge.y) for ge in mg] == [type(mg[i].y) for i in range(len(mg))]
+
+    sg = HyperGrid(x=[1, 2]) + HyperGrid(x=[0.5])
+    assert [type(x) for x in sg.to_columns()["x"].tolist()] == [int, int, float]
+
+
+def test_batch_filter_len():
+    g = HyperGrid(example=range(100), example2=range(100))
+    fg = g.filter_batch(lambda cols: (cols["example"] + cols["example2"]) % 4 == 0)
+    assert len(fg) == 2500
+    assert fg._iter_cache is None
@@ -1,4 +1,9 @@
+from sklearn.datasets import make_classification
+from sklearn.model_selection import GridSearchCV, ParameterGrid
+from sklearn.tree import DecisionTreeClassifier
+
 from hypergrid.dsl import HyperGrid
+from hypergrid.ext.sklearn import HyperGridSearchCV, ParameterSequence
 
 
 def test_basic_grid_sklearn_conversion():
@@ -7,3 +12,35 @@ def test_basic_grid_sklearn_conversion():
     pg = (g * g2).to_sklearn()
     assert set(pg.param_grid[0].keys()) == {"test", "test2"}
     assert len([i for i in pg]) == 9
+
+
+def test_composed_grid_sklearn_conversion():
+    g = (HyperGrid(a=[1, 2]) + HyperGrid(a=[3])) * HyperGrid(b=range(10**9))
+    pg = g.to_sklearn()
+    assert isinstance(pg, ParameterGrid)
+    assert len(pg) == len(g) == 3 * 10**9
+    assert {"a": 3, "b": 5} == pg[2 * 10**9 + 5]
+
+
+def test_lazy_sklearn_conversion():
+    g = (HyperGrid(a=range(10**4)) & HyperGrid(b=range(10**4))).filter(lambda ge: ge.a % 2 == 0)
+    ps = g.to_sklearn()
+    assert isinstance(ps, ParameterSequence)
+    assert len(ps) == 5000
+    assert ps[3] == {"a": 6, "b": 6}
+    assert ps[:2] == [{"a": 0, "b": 0}, {"a": 2, "b": 2}]
+
+
+def test_hypergrid_search_cv():
+    X, y = make_classification(n_samples=60, random_state=0)
+    g = HyperGrid(max_depth=[1, 2, 3, None], min_samples_split=[2, 4, 8]).filter(lambda ge: ge.max_depth is not None or ge.min_samples_split > 2)
+    search = HyperGridSearchCV(DecisionTreeClassifier(random_state=0), g, cv=3).fit(X, y)
+    assert search.cv_results_["params"] == list(g.to_sklearn())
+    assert search.best_params_ in list(g.to_sklearn())
+
+    # Plain grids search the same candidates as GridSearchCV
+    g = HyperGrid(max_depth=[1, 2], min_samples_split=[2, 4])
+    expected = GridSearchCV(DecisionTreeClassifier(random_state=0), {"max_depth": [1, 2], "min_samples_split": [2, 4]}, cv=3).fit(X, y)
+    search = HyperGridSearchCV(DecisionTreeClassifier(random_state=0), g, cv=3).fit(X, y)
+    assert search.cv_results_["params"] == expected.cv_results_["params"]
+    assert list(search.cv_results_["mean_test_score"]) == list(expected.cv_results_["mean_test_score"])
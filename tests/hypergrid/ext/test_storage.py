@@ -0,0 +1,46 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pytest
+
+from hypergrid.ext.numpy import ChunkedColumn
+from hypergrid.grid import HyperGrid
+
+
+@dataclass
+class FakeModel:
+    x: int
+
+
+def _grid():
+    g = HyperGrid(example=range(50), example2=["a", "bb", "ccc"]) * HyperGrid(example3=[0.5, 1.5])
+    return g.filter(lambda ge: ge.example % 3 != 0)
+
+
+def test_npy_roundtrip(tmp_path):
+    g = _grid()
+    g.to_npy(tmp_path / "grid", chunk_size=64)
+    loaded = HyperGrid.from_file(tmp_path / "grid")
+    assert list(loaded) == list(g)
+    assert len(loaded) == len(g)
+    assert loaded[150] == g[150]
+    assert list(loaded.shard(1, 3)) == list(g.shard(1, 3))
+    column = loaded.grid1.grid1.dimensions[0].values
+    assert isinstance(column, ChunkedColumn)
+    assert isinstance(column.array(0, 10), np.memmap)
+    assert column.array(60, 70).tolist() == [ge.example for ge in g[60:70]]
+
+
+def test_npy_objects(tmp_path):
+    g = HyperGrid(x=range(5)).instantiate(model=FakeModel)
+    g.to_npy(tmp_path, chunk_size=2)
+    assert [ge.model for ge in HyperGrid.from_file(tmp_path)] == [FakeModel(x) for x in range(5)]
+
+
+def test_parquet_roundtrip(tmp_path):
+    pytest.importorskip("pyarrow")
+    g = _grid()
+    g.to_parquet(tmp_path / "grid.parquet", chunk_size=64)
+    loaded = HyperGrid.from_file(tmp_path / "grid.parquet")
+    assert list(loaded) == list(g)
+    assert loaded[-1] == g[-1]
@@ -1,6 +1,10 @@
+import random
 from itertools import islice
 
-from hypergrid.gen.distribution import Uniform
+import numpy as np
+import pytest
+
+from hypergrid.gen.distribution import Categorical, Distribution, IntUniform, LogUniform, Normal, Uniform
 from hypergrid.grid import HyperGrid
 
 
@@ -15,3 +19,42 @@ def test_uniform_distribution():
     ud = Uniform(low=1, high=10)
 
     assert all([1 <= rn <= 10 for rn in islice(ud, 100)])
+
+
+@pytest.mark.parametrize(
+    "distribution, low, high",
+    [(Uniform(1, 10), 1, 10), (LogUniform(1e-4, 1e-1), 1e-4, 1e-1), (Normal(0, 1), -10, 10), (IntUniform(2, 5), 2, 5)],
+)
+def test_sample_batch(distribution, low, high):
+    batch = distribution.sample_batch(10000, rng=np.random.default_rng(0))
+    assert batch.shape == (10000,)
+    assert low <= batch.min() and batch.max() <= high
+    assert np.array_equal(batch, distribution.sample_batch(10000, rng=np.random.default_rng(0)))
+    assert all(low <= distribution.sample() <= high for _ in range(100))
+
+
+class Coin(Distribution):
+    def sample(self, rng=None):
+        return (rng or random).random() < 0.5
+
+
+def test_default_sample_batch_uses_rng():
+    batch = Coin().sample_batch(100, rng=np.random.default_rng(0))
+    assert np.array_equal(batch, Coin().sample_batch(100, rng=np.random.default_rng(0)))
+    assert not np.array_equal(batch, Coin().sample_batch(100, rng=np.random.default_rng(1)))
+    assert Coin().sample_batch(5).shape == (5,)
+
+
+def test_int_uniform_endpoints():
+    assert set(IntUniform(2, 5).sample_batch(1000).tolist()) == {2, 3, 4, 5}
+    assert IntUniform(2, 5).ppf(np.array([0.0, 0.999])).tolist() == [2, 5]
+
+
+def test_categorical():
+    c = Categorical([1, "a", None], weights=[0, 1, 1])
+    batch = c.sample_batch(1000)
+    assert set(batch.tolist()) == {"a", None}
+    assert c.sample() in ("a", None)
+    assert len(c.take_array(5)) == 5
+    assert c.ppf(np.array([0.0, 0.49, 0.51])).tolist() == ["a", "a", None]
+    assert Normal(1, 2).ppf(0.5) == 1
@@ -1,6 +1,8 @@
 import math
 from itertools import islice
 
+import numpy as np
+
 from hypergrid.gen.iterable import ExponentialStep
 from hypergrid.grid import HyperGrid
 
@@ -24,3 +26,13 @@ def test_exponential_sequence():
     assert all([math.isclose(p[0], p[1]) for p in zip(islice(es, 5), [1, 1.1, 1.21, 1.331, 1.4641])])
     assert es.take(5).name == "anonymous"
     assert es.with_name("test").take(5).name == "test"
+
+    es = ExponentialStep(start=0.1, step=3)
+    assert list(es.take(40).values) == list(islice(es, 40))
+    assert list(islice(es, 3))[2] == es.take(3).values[2] == 0.1 * 3**2
+
+
+def test_exponential_take_array():
+    es = ExponentialStep(start=2, step=1.5)
+    assert np.allclose(es.take_array(200), list(islice(es, 200)), rtol=1e-14)
+    assert len(es.take_array(0)) == 0
@@ -0,0 +1,76 @@
+import random
+
+import numpy as np
+import pytest
+
+from hypergrid.gen.distribution import Distribution, Uniform
+from hypergrid.gen.quasi import Halton, LatinHypercube, Sobol, quasi_grid
+from hypergrid.grid import HyperGrid
+
+
+@pytest.mark.parametrize("sampler", [Halton, LatinHypercube, Sobol])
+def test_unit_cube(sampler):
+    points = sampler(3, seed=0).random(64)
+    assert points.shape == (64, 3)
+    assert ((points >= 0) & (points < 1)).all()
+    assert np.array_equal(points, sampler(3, seed=0).random(64))
+
+
+def test_latin_hypercube_strata():
+    points = LatinHypercube(2, seed=1).random(10)
+    for column in points.T:
+        assert sorted(np.floor(column * 10).astype(int).tolist()) == list(range(10))
+
+
+@pytest.mark.parametrize("method", ["halton", "lhs", "sobol"])
+def test_sample_quasi(method):
+    g = HyperGrid(example=range(8), example2=["a", "b", "c", "d"]) * HyperGrid(example3=[0.5, 1.5])
+    samples = g.sample_quasi(16, method=method, seed=0)
+    assert len(samples) == 16
+    assert all(ge in list(g) for ge in samples)
+    # Low-discrepancy and stratified samples cover every value of each dimension evenly
+    assert sorted({ge.example for ge in samples}) == list(range(8))
+    assert abs(sum(ge.example3 == 0.5 for ge in samples) - 8) <= 1
+
+
+def test_sample_quasi_filtered():
+    g = HyperGrid(example=range(10), example2=range(10)).filter(lambda ge: ge.example < ge.example2)
+    samples = g.sample_quasi(20, seed=0)
+    assert len(samples) == 20
+    assert all(ge.example < ge.example2 for ge in samples)
+    with pytest.raises(ValueError):
+        g.filter(lambda ge: False).sample_quasi(5)
+
+
+@pytest.mark.parametrize("method", ["halton", "lhs", "sobol"])
+def test_sample_quasi_selective(method):
+    g = HyperGrid(x=range(10), y=range(10)).filter(lambda ge: ge.x + ge.y == 9)
+    for seed in range(20):
+        samples = g.sample_quasi(2, method=method, seed=seed)
+        assert len(samples) == 2
+        assert all(ge.x + ge.y == 9 for ge in samples)
+
+
+def test_sample_quasi_pushed_down():
+    g = HyperGrid(a=range(10), b=range(10)).filter(lambda ge: ge.a < 3)
+    assert g._pushed_down is not None
+    samples = g.sample_quasi(210, seed=0)
+    assert all(ge.a < 3 for ge in samples)
+    assert all(abs(sum(ge.a == a for ge in samples) - 70) <= 2 for a in range(3))
+    assert all(abs(sum(ge.b == b for ge in samples) - 21) <= 1 for b in range(10))
+
+
+def test_quasi_grid():
+    g = quasi_grid(32, "sobol", seed=0, lr=Uniform(0, 1), dropout=Uniform(0.1, 0.5))
+    assert len(g) == 32
+    assert all(0 <= ge.lr < 1 and 0.1 <= ge.dropout < 0.5 for ge in g)
+
+
+class Coin(Distribution):
+    def sample(self, rng=None):
+        return (rng or random).random() < 0.5
+
+
+def test_quasi_grid_requires_ppf():
+    with pytest.raises(TypeError, match="Coin for dimension 'flip'"):
+        quasi_grid(8, lr=Uniform(0, 1), flip=Coin())
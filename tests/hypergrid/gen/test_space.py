@@ -0,0 +1,62 @@
+import math
+import random
+
+import numpy as np
+import pytest
+
+from hypergrid.dimension import Dimension
+from hypergrid.gen.iterable import ExponentialStep
+from hypergrid.gen.space import GeometricRange, arange, geomspace, linspace, logspace
+from hypergrid.grid import HyperGrid
+
+
+def test_ranges_match_numpy():
+    assert np.allclose(list(arange(0.5, 3, 0.25)), np.arange(0.5, 3, 0.25))
+    assert np.allclose(list(linspace(0, 1, 11)), np.linspace(0, 1, 11))
+    assert np.allclose(list(linspace(0, 1, 10, endpoint=False)), np.linspace(0, 1, 10, endpoint=False))
+    assert np.allclose(list(logspace(-4, -1, 7)), np.logspace(-4, -1, 7))
+    assert np.allclose(list(geomspace(1, 1000, 4)), np.geomspace(1, 1000, 4))
+    assert np.allclose(list(geomspace(-1, -1000, 4)), np.geomspace(-1, -1000, 4))
+    assert list(geomspace(2, 50, 3)) == np.geomspace(2, 50, 3).tolist() == [2.0, 10.0, 50.0]
+    assert list(geomspace(-3, -7e4, 1)) == [-3.0]
+    assert geomspace(3e-5, 7e4, 10001)[-1] == 7e4
+    assert list(arange(3, 0, 1)) == []
+    for values in [arange(0.5, 3, 0.25), logspace(-4, -1, 7), ExponentialStep(start=1, step=2).take(5).values]:
+        assert np.allclose(Dimension(x=values).to_grid().to_columns()["x"], list(values))
+
+
+def test_range_columns_match_iteration():
+    for values in [logspace(-7, 3, 100001), geomspace(3e-5, 7e4, 10001), GeometricRange(0.1, 1.0001, 10001), linspace(-3, 7, 10001)]:
+        assert Dimension(x=values).to_grid().to_columns()["x"].tolist() == list(values)
+    g = HyperGrid(a=logspace(-7, 3, 10001))
+    m = g.map_to_batch(b=lambda cols: cols["a"] * 2)
+    assert [ge.a for ge in m] == list(g.dimensions[0].values)
+    assert all(m[i] == ge for i, ge in enumerate(m))
+
+
+def test_lazy_dimension():
+    d = Dimension(lr=logspace(-8, 0, 10**12))
+    assert len(d) == 10**12
+    assert math.isclose(d[-1], 1.0)
+    assert math.isclose(d[0], 1e-8)
+    assert 1e-8 <= d.sample(random.Random(0)) <= 1.0
+    with pytest.raises(IndexError):
+        d[10**12]
+    g = HyperGrid(d, x=linspace(0, 1, 10**6))
+    assert len(g) == 10**18
+    assert g[10**18 - 1].x == 1.0
+
+
+def test_array_dimension(tmp_path):
+    values = np.lib.format.open_memmap(tmp_path / "values.npy", mode="w+", dtype=np.float64, shape=(1000,))
+    values[:] = np.arange(1000)
+    d = Dimension(x=values)
+    assert d._indexable is values
+    assert d[999] == 999
+    assert d.sample() in range(1000)
+
+
+def test_exponential_take_is_lazy():
+    d = ExponentialStep(start=1, step=2).take(10**9)
+    assert isinstance(d.values, GeometricRange)
+    assert d[10] == 1024
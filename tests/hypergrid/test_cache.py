@@ -0,0 +1,41 @@
+from dataclasses import dataclass
+
+from hypergrid.cache import LRU, Memoized, memoize
+from hypergrid.grid import HyperGrid
+from hypergrid.util import dependencies, instantiate_lambda
+
+
+def test_memoized_map_to():
+    @dataclass
+    class Model:
+        example: int
+        example2: str
+
+    builds = []
+
+    def build(ge):
+        builds.append(ge)
+        return instantiate_lambda(Model)(ge)
+
+    g = HyperGrid(example=[1, 2, 3], example2=["a", "b"]).map_to(model=memoize(build, maxsize=None))
+    first = list(g)
+    second = list(g)
+    assert len(builds) == 6
+    assert all(ge1.model is ge2.model for ge1, ge2 in zip(first, second))
+    assert g.dimension_mapping["model"].cache_info().hits == 6
+    assert repr(g).endswith("model=build)")
+
+
+def test_lru_eviction():
+    cache = LRU(maxsize=2)
+    square = Memoized(lambda ge: ge.example**2, cache)
+    g = HyperGrid(example=[1, 2, 3]).map(squared=square)
+    assert [ge.squared for ge in g] == [1, 4, 9]
+    assert [ge.squared for ge in g] == [1, 4, 9]
+    assert cache.cache_info() == (0, 6, 2, 2)
+
+    unhashable = memoize(lambda ge: len(ge.example))
+    assert [ge.n for ge in HyperGrid(example=[[1], [1, 2]]).map(n=unhashable)] == [1, 2]
+    assert unhashable.cache_info().currsize == 0
+    assert unhashable.cache_info().misses == 2
+    assert dependencies(memoize(lambda ge: ge.example)) == {"example"}
@@ -0,0 +1,31 @@
+import itertools
+import pickle
+
+import pytest
+
+from hypergrid.grid import HyperGrid
+
+
+def test_cursor_resume():
+    calls = []
+
+    def predicate(ge):
+        calls.append(ge)
+        return ge.example % 3 != 0
+
+    g = (HyperGrid(example=range(10)) * HyperGrid(example2=["a", "b"]) + HyperGrid(example=range(5), example2=["c"])).filter(predicate)
+    expected = list(g)
+    for stop in range(len(expected) + 1):
+        cursor = g.iter_from()
+        head = list(itertools.islice(cursor, stop))
+        state = pickle.loads(pickle.dumps(cursor.state()))
+        calls.clear()
+        assert head + list(g.iter_from(state)) == expected
+        assert len(calls) <= g._positions - state
+
+
+def test_cursor_bounds():
+    g = HyperGrid(example=range(4))
+    assert list(g.iter_from(4)) == []
+    with pytest.raises(AssertionError):
+        g.iter_from(5)
@@ -0,0 +1,36 @@
+import pytest
+
+from hypergrid.dedup import BloomFilter, ExactSet
+from hypergrid.grid import HyperGrid
+
+
+@pytest.mark.parametrize("spill_after", [None, 3])
+def test_exact_set(spill_after, tmp_path):
+    seen = ExactSet(spill_after=spill_after, directory=str(tmp_path))
+    assert [seen.add(key) for key in [1, 2, (1, "a"), 1.0, 3, 4, 2, (1, "a"), 5]] == [True, True, True, False, True, True, False, False, True]
+    assert bool(list(tmp_path.iterdir())) == (spill_after is not None)
+    seen.close()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_bloom_filter():
+    bloom = BloomFilter(capacity=10000, error_rate=0.01)
+    assert sum(bloom.add(i) for i in range(0, 20000, 2)) > 0.98 * 10000
+    assert not any(bloom.add(i) for i in range(0, 20000, 2))
+    false_positives = sum(i in bloom for i in range(1, 20000, 2))
+    assert false_positives < 0.02 * 10000
+
+
+@pytest.mark.parametrize("method", ["exact", "bloom"])
+def test_distinct(method):
+    g = HyperGrid(a=range(10), b=range(10)) + HyperGrid(b=range(5, 15), a=range(10))
+    expected = list(dict.fromkeys((ge.a, ge.b) for ge in g))
+    dg = g.distinct(method=method)
+    assert len(g) == 200
+    assert [(ge.a, ge.b) for ge in dg] == expected
+    assert len(dg) == len(expected) == 150
+    assert dg[-1] == list(dg)[-1]
+    assert dg.sample() in list(dg)
+
+    mapped = HyperGrid(a=range(100)).map(parity=lambda ge: ge.a % 2).distinct(method=method, spill_after=1)
+    assert list(mapped) == [(0,), (1,)] and len(mapped) == 2
@@ -18,3 +18,12 @@ def test_dimension_construct():
 def test_dimension_iter():
     dim = Dimension(test=[1, 2, 3])
     assert len([i for i in dim]) == 3
+
+
+def test_dimension_getitem():
+    dim = Dimension(test=[1, 2, 3])
+    assert dim[0] == 1
+    assert dim[-1] == 3
+
+    dim = Dimension(test={"a", "b", "c"})
+    assert [dim[i] for i in range(len(dim))] == list(dim)
@@ -0,0 +1,26 @@
+import pickle
+
+from hypergrid.element import element_type
+from hypergrid.grid import HyperGrid
+
+
+def test_element_types_are_interned():
+    g1 = HyperGrid(example=[1, 2], example2=["a"])
+    g2 = HyperGrid(example=[3], example2=["b", "c"])
+    assert g1.grid_element is g2.grid_element is element_type(["example", "example2"])
+    assert (g1 * HyperGrid(example3=[1])).grid_element is (g2 * HyperGrid(example3=[2])).grid_element
+    assert repr(g1[0]) == "GridElement(example=1, example2='a')"
+
+
+def test_element_pickling():
+    g = HyperGrid(example=[1, 2], example2=["a"]) * HyperGrid(example3=range(3))
+    ge = g[4]
+    assert pickle.loads(pickle.dumps(ge)) == ge
+    assert type(pickle.loads(pickle.dumps(ge))) is g.grid_element
+    assert pickle.loads(pickle.dumps(g.grid_element)) is g.grid_element
+    assert list(pickle.loads(pickle.dumps(g))) == list(g)
+
+
+def test_compiled_tuples():
+    g = HyperGrid(example=[1, 2], example2=["a", "b"]).filter(lambda ge: ge.example > 1)
+    assert list(g.compile(as_tuples=True)) == [(2, "a"), (2, "b")]
@@ -0,0 +1,50 @@
+import asyncio
+import multiprocessing
+
+import pytest
+
+from hypergrid.grid import HyperGrid
+
+
+@pytest.mark.parametrize("executor", ["process", "thread"])
+def test_run(executor):
+    g = HyperGrid(example=range(50), example2=range(4)).filter(lambda ge: ge.example % 3 != 0).map_to(example3=lambda ge: ge.example * 10)
+    expected = [ge.example3 + ge.example2 for ge in g]
+    results = g.run(lambda ge: ge.example3 + ge.example2, executor=executor, workers=2, chunksize=7)
+    assert list(results) == expected
+    results = g.run(lambda ge: ge.example3 + ge.example2, executor=executor, workers=2, chunksize=7, ordered=False)
+    assert sorted(results) == sorted(expected)
+
+
+def add_example3(ge):
+    return ge.example3 + ge.example2
+
+
+@pytest.mark.parametrize("start_method", ["spawn", "fork"])
+def test_run_start_methods(start_method):
+    # Only `func` is pickled for spawned workers, so the grid's lambdas are fine
+    g = HyperGrid(example=range(50), example2=range(4)).filter(lambda ge: ge.example % 3 != 0).map_to(example3=lambda ge: ge.example * 10)
+    context = multiprocessing.get_context(start_method)
+    results = g.run(add_example3, workers=2, chunksize=7, mp_context=context)
+    assert list(results) == [add_example3(ge) for ge in g]
+
+
+def test_async_execution():
+    g = HyperGrid(example=range(100), example2=range(3))
+    in_flight = []
+
+    async def evaluate(ge):
+        in_flight.append(1)
+        assert len(in_flight) <= 4
+        await asyncio.sleep(0)
+        in_flight.pop()
+        return ge.example * ge.example2
+
+    async def main():
+        elements = [ge async for ge in g.aiter(yield_every=7)]
+        results = await g.arun(evaluate, concurrency=4)
+        return elements, results
+
+    elements, results = asyncio.run(main())
+    assert elements == list(g)
+    assert results == [ge.example * ge.example2 for ge in g]
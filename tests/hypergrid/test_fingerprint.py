@@ -0,0 +1,95 @@
+import os
+import subprocess
+import sys
+import types
+
+import pytest
+
+from hypergrid.cache import _MISSING, DiskCache, set_cache_dir
+from hypergrid.dsl import linspace
+from hypergrid.grid import HyperGrid
+
+THRESHOLD = 3
+cfg = types.SimpleNamespace(LIMIT=3)
+
+
+def declare(threshold=3):
+    g = HyperGrid(x=range(10), y=["a", "b"], z=linspace(0, 1, 5))
+    return (g * HyperGrid(w={"b", "a"})).filter(lambda ge: ge.x > threshold).map_to(xz=lambda ge: ge.x * ge.z).select("x", "xz")
+
+
+def test_fingerprint():
+    assert declare().fingerprint() == declare().fingerprint()
+    assert declare().fingerprint() != declare(threshold=4).fingerprint()
+    assert HyperGrid(x=range(3)).fingerprint() != HyperGrid(x=[0, 1, 2]).fingerprint()
+    assert HyperGrid(x=[1]).fingerprint() != HyperGrid(x=[1.0]).fingerprint()
+    assert HyperGrid(x=[1]).filter(lambda ge: ge.x > 1).fingerprint() != HyperGrid(x=[1]).filter(lambda ge: ge.x >= 1).fingerprint()
+
+    global THRESHOLD
+    g = HyperGrid(x=range(10)).filter(lambda ge: ge.x > THRESHOLD)
+    before = g.fingerprint()
+    THRESHOLD = 5
+    assert g.fingerprint() != before
+    THRESHOLD = 3
+
+
+def test_fingerprint_across_processes():
+    code = (
+        "from hypergrid.grid import HyperGrid; "
+        "print((HyperGrid(x=range(4), y=('a', 'b')).filter(lambda ge: ge.y != 'a') + HyperGrid(y=['c'], x=[5])).fingerprint())"
+    )
+    fingerprints = {
+        subprocess.run([sys.executable, "-c", code], env=os.environ | {"PYTHONHASHSEED": seed}, capture_output=True, text=True, check=True).stdout
+        for seed in ["1", "2"]
+    }
+    assert len(fingerprints) == 1
+
+
+def test_disk_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr("hypergrid.cache._cache_dir", None)
+
+    def declare():
+        return HyperGrid(x=range(30), y=range(30)).filter(lambda ge: (ge.x + ge.y) % 3 == 0)
+
+    key = declare().fingerprint()
+    assert len(declare()) == 300
+    assert DiskCache(tmp_path).get(f"{key}-len") is _MISSING
+
+    set_cache_dir(tmp_path)
+    assert len(declare()) == 300
+    assert DiskCache(tmp_path).get(f"{key}-len") == 300
+    # Planted entries prove that later, separately declared grids read the cache instead of recounting
+    DiskCache(tmp_path).put(f"{key}-len", 7)
+    assert len(declare()) == 7
+    DiskCache(tmp_path).put(f"{key}-contents", [(1, 2)])
+    assert declare()[0] == (1, 2)
+    assert len(HyperGrid(x=range(4), y=["a", "a"]).distinct()) == 4
+
+    DiskCache(tmp_path).clear()
+    assert len(declare()) == 300
+    # Unpicklable values are just not cached
+    DiskCache(tmp_path).put("key", lambda: None)
+    assert DiskCache(tmp_path).get("key") is _MISSING
+
+
+def test_undescribable_state_is_not_cached(tmp_path, monkeypatch):
+    monkeypatch.setattr("hypergrid.cache._cache_dir", tmp_path)
+    monkeypatch.setattr(cfg, "LIMIT", 3)
+
+    def declare():
+        return HyperGrid(x=range(10), y=range(2)).filter(lambda ge: ge.x + ge.y < cfg.LIMIT)
+
+    assert len(declare()) == 5
+    cfg.LIMIT = 8
+    g = declare()
+    assert len(g) == len(list(g)) == 15
+    assert list(tmp_path.iterdir()) == []
+    with pytest.raises(ValueError):
+        g.fingerprint()
+    with pytest.raises(ValueError):
+        HyperGrid(x=[1]).map(model=lambda ge: Model(ge.x)).fingerprint()
+
+
+class Model:
+    def __init__(self, x):
+        self.x = x
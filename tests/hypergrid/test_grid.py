@@ -1,16 +1,19 @@
+import itertools
 import operator
+import random
 from dataclasses import dataclass
 from functools import reduce
 from math import prod
 from typing import cast
 
 import pytest
-from hypothesis import given
+from hypothesis import given, settings
 from hypothesis import strategies as st
 from hypothesis.strategies import DrawFn, composite
 
 from hypergrid.dimension import Dimension
-from hypergrid.grid import HyperGrid
+from hypergrid.grid import HyperGrid, SumGrid
+from hypergrid.util import dependencies, depends_on
 
 
 @composite
@@ -65,6 +68,21 @@ def test_grid_sums(lists):
     assert len([e for e in reduce(operator.or_, gs[1:], gs[0])]) == sum([len(hlist) for hlist in lists])
 
 
+def test_nested_sums(monkeypatch):
+    # Iteration chains the leaves of a nested sum directly, so depth isn't limited by the recursion limit
+    deep = reduce(operator.add, [HyperGrid(example=[i, -i]) for i in range(3000)])
+    assert list(iter(deep)) == [(v,) for i in range(3000) for v in (i, -i)]
+
+    # Sub-grid lengths are computed once, not at every level of every lookup
+    lens = []
+    original_len = HyperGrid.__len__
+    monkeypatch.setattr(HyperGrid, "__len__", lambda self: lens.append(self) or original_len(self))
+    nested = reduce(operator.add, [HyperGrid(example=[i, -i]) for i in range(200)])
+    assert [nested[i] for i in range(len(nested))] == [(v,) for i in range(200) for v in (i, -i)]
+    assert nested.sample(random.Random(0)) in list(nested)
+    assert len(lens) == 200
+
+
 def test_grid_sum_raw():
     g = HyperGrid(test=[1, 2, 3])
     rd = ("test", [1, 2, 3])
@@ -160,3 +178,212 @@ def test_sampling():
     g = HyperGrid(example=[1, 2, 3])
     g = g & ("test3", range(100))
     assert all([1 <= (sample := g.sample()).example <= 3 and 0 <= sample.test3 <= 2 for _ in range(100)])
+
+
+# Indexing every element of a generated grid takes time linear in its size, which can reach ~10^5 elements
+@settings(deadline=None)
+@given(het_typed_lists())
+def test_hgrid_getitem(lists):
+    g1 = HyperGrid(**{f"example{i}": v for i, v in enumerate(lists)})
+    assert [g1[i] for i in range(len(g1))] == list(g1)
+
+
+def test_composed_getitem():
+    g = HyperGrid(example=[1, 2, 3], example2=["a", "b"]) + HyperGrid(example=[4, 5], example2=["c"])
+    g = g * HyperGrid(example3=range(4))
+    g = g & HyperGrid(example4=range(100))
+    g = g.select("example", "example3", "example4").map_to(example5=lambda ge: ge.example * 2)
+    manifested_list = list(g)
+    assert [g[i] for i in range(len(g))] == manifested_list
+    assert g[-1] == manifested_list[-1]
+    assert g[3:10:2] == manifested_list[3:10:2]
+    with pytest.raises(IndexError):
+        g[len(g)]
+
+    fg = HyperGrid(example=range(20)).filter(lambda ge: ge.example % 3 == 0).map(example2=lambda ge: ge.example + 1)
+    assert [fg[i] for i in range(len(fg))] == list(fg)
+
+
+@pytest.mark.parametrize("strided", [False, True])
+@pytest.mark.parametrize("count", [1, 3, 7, 100])
+def test_shards(count, strided):
+    g = HyperGrid(example=range(10), example2=["a", "b", "c"]).filter(lambda ge: ge.example % 2 == 0)
+    g = g + HyperGrid(example=[20, 21], example2=["d"])
+    g = g * HyperGrid(example3=range(3))
+    g = g.map_to(example4=lambda ge: ge.example * ge.example3)
+    shards = [list(g.shard(index=k, count=count, strided=strided)) for k in range(count)]
+    flattened = [ge for shard in shards for ge in shard]
+    assert len(flattened) == len(g)
+    assert sorted(flattened) == sorted(g)
+    if not strided:
+        assert flattened == list(g)
+
+    with pytest.raises(AssertionError):
+        g.shard(index=count, count=count)
+
+
+def test_unique_sampling():
+    g = HyperGrid(example=range(20), example2=range(5)) + HyperGrid(example=range(20, 30), example2=range(5))
+    samples = g.sample_unique(50)
+    assert len(set(samples)) == 50
+    assert sorted(g.shuffled()) == sorted(g)
+    with pytest.raises(ValueError):
+        g.sample_unique(len(g) + 1)
+
+    fg = g.filter(lambda ge: ge.example % 2 == 0).map_to(example3=lambda ge: ge.example * 2)
+    assert sorted(fg.shuffled()) == sorted(fg)
+    assert len(set(fg.sample_unique(len(fg)))) == len(fg)
+
+
+def test_filter_pushdown():
+    calls = []
+
+    @depends_on("optimizer")
+    def predicate(ge):
+        calls.append(ge)
+        return ge.optimizer != "sgd"
+
+    g = HyperGrid(optimizer=["sgd", "adam", "lion"]) * HyperGrid(lr=range(100), bs=[16, 32])
+    fg = g.filter(predicate)
+    assert list(fg) == [ge for ge in g if ge.optimizer != "sgd"]
+    assert len(fg) == 400
+    assert len(calls) == 3
+
+    calls.clear()
+    hg = HyperGrid(lr=range(100), optimizer=["sgd", "adam", "lion"], bs=[16, 32])
+    fg = hg.filter(predicate).filter(lambda ge: ge.lr < 10 and ge.bs > 16)
+    assert list(fg) == [ge for ge in hg if ge.optimizer != "sgd" and ge.lr < 10 and ge.bs > 16]
+    assert list(fg.compile()) == list(fg)
+    assert fg[5] == list(fg)[5]
+    assert len(calls) == 3
+
+    # Planning a pushdown through a sum neither counts its branches nor discards branches filtered to empty
+    calls.clear()
+    sg = HyperGrid(optimizer=["sgd"], lr=range(10)) + HyperGrid(optimizer=["adam", "lion"], lr=range(10))
+    fg = sg.filter(predicate)
+    assert isinstance(fg._pushed_down, SumGrid) and isinstance(fg._pushed_down.grid1, HyperGrid)
+    assert len(calls) == 3
+    assert list(fg) == list(sg)[10:]
+
+    calls.clear()
+    sg = HyperGrid(lr=range(10), bs=[16, 32], optimizer=["sgd"]) + HyperGrid(lr=range(10), bs=[16, 32], optimizer=["adam"])
+    fg = sg.filter(depends_on("lr", "bs")(lambda ge: calls.append(ge) or ge.lr < 5 and ge.bs > 16))
+    assert fg._pushed_down is not None
+    assert calls == []
+    assert len(fg) == 10
+
+
+def test_large_dimension_pushdown_is_lazy(monkeypatch):
+    monkeypatch.setattr("hypergrid.grid._POOL_LIMIT", 8)
+    calls = []
+
+    @depends_on("lr")
+    def predicate(ge):
+        calls.append(ge)
+        return ge.lr % 3 == 0
+
+    g = HyperGrid(lr=range(30), bs=[16, 32])
+    fg = g.filter(predicate)
+    assert fg._pushed_down is not None
+    assert calls == []
+    assert list(fg.shard(1, 3)) == [ge for ge in g if ge.lr % 3 == 0 and 20 <= ge.lr * 2 + (ge.bs == 32) < 40]
+    # Only the shard's own 20 positions are checked
+    assert len(calls) == 20
+    assert list(fg) == [ge for ge in g if ge.lr % 3 == 0]
+
+    # Small dimensions are still filtered up front
+    calls.clear()
+    assert HyperGrid(lr=range(6), bs=[16, 32]).filter(predicate)._pushed_down is not None
+    assert len(calls) == 6
+
+
+def test_dependency_inference():
+    assert dependencies(lambda ge: ge.lr * ge.bs < 1e3) == {"lr", "bs"}
+    assert dependencies(lambda ge: len(ge) > 1) is None
+    assert dependencies(lambda ge: [ge for _ in range(2)]) is None
+    assert dependencies(depends_on("lr")(lambda ge: ge.lr)) == {"lr"}
+
+
+class Threshold:
+    def __init__(self, lr):
+        self.lr = lr
+
+    def check(self, ge):
+        return ge.batch > 1 and ge.lr < self.lr
+
+
+def test_method_dependency_inference():
+    threshold = Threshold(0.5)
+    assert dependencies(threshold.check) == {"batch", "lr"}
+    g = HyperGrid(lr=[0.1, 0.9], batch=[1, 2])
+    assert list(g.filter(threshold.check)) == [(0.1, 2)]
+
+
+def test_projection_pruning():
+    calls = []
+
+    def expensive(ge):
+        calls.append(ge)
+        return ge.example * 2
+
+    g = HyperGrid(example=range(10)).map_to(doubled=expensive, tripled=lambda ge: ge.example * 3).select("example", "tripled")
+    assert [ge.tripled for ge in g] == [i * 3 for i in range(10)]
+    assert g[3].tripled == 9
+    assert calls == []
+
+
+def test_filter_len():
+    g = HyperGrid(example=range(100), example2=range(100))
+    fg = g.filter(lambda ge: (ge.example + ge.example2) % 4 == 0)
+    assert len(fg) == 2500
+    assert fg._iter_cache is None
+
+    nested = fg + g.filter(lambda ge: ge.example < ge.example2)
+    assert len(nested) == 2500 + 4950
+    assert 0.8 * len(nested) < nested.filter(lambda ge: ge.example > 0).estimate_len(samples=2000) < 1.2 * len(nested)
+    assert (g * HyperGrid(example3=[1, 2])).estimate_len() == 20000
+
+
+def test_streamed_iteration(monkeypatch):
+    # Shrink the pooling limit so that "large" dimensions are cheap to build
+    monkeypatch.setattr("hypergrid.grid._POOL_LIMIT", 5)
+    monkeypatch.setattr("hypergrid.grid._CHUNK_SIZE", 4)
+    g = HyperGrid(a=range(3), b=range(7), c=["x", "y"], d=range(6))
+    expected = [(a, b, c, d) for a in range(3) for b in range(7) for c in ["x", "y"] for d in range(6)]
+    assert list(g) == expected
+    assert list(g.compile()) == expected
+
+    grid2 = HyperGrid(e=range(6))
+    assert list(g * grid2) == [(*ge1, e) for ge1 in expected for e in range(6)]
+    assert list(grid2 * HyperGrid(f=range(2))) == [(e, f) for e in range(6) for f in range(2)]
+
+    # Several large dimensions, and empty dimensions before or after them
+    g = HyperGrid(a=range(7), b=range(3), c=range(9))
+    assert list(g) == list(g.compile()) == [(a, b, c) for a in range(7) for b in range(3) for c in range(9)]
+    assert list(HyperGrid(a=[], b=range(7))) == list(HyperGrid(a=range(7), b=[])) == []
+
+
+def test_huge_dimensions_stream():
+    # itertools.product would copy the billion-value range into a tuple before yielding anything
+    g = HyperGrid(a=["x", "y"], b=range(10**9), c=[1, 2])
+    assert list(itertools.islice(g, 3)) == [("x", 0, 1), ("x", 0, 2), ("x", 1, 1)]
+    assert next(iter(g.compile(as_tuples=True))) == ("x", 0, 1)
+
+
+def test_product_iterates_functions_once(monkeypatch):
+    calls = []
+
+    def double(ge):
+        calls.append(ge)
+        return ge.b * 2
+
+    grid2 = HyperGrid(b=range(4)).map_to(c=double)
+    assert list(HyperGrid(a=range(5)) * grid2) == [(a, b, b * 2) for a in range(5) for b in range(4)]
+    assert len(calls) == 4
+
+    # A large grid2 is re-iterated rather than pooled only if that doesn't re-run its functions
+    monkeypatch.setattr("hypergrid.grid._POOL_LIMIT", 2)
+    calls.clear()
+    assert list(HyperGrid(a=range(5)) * grid2) == [(a, b, b * 2) for a in range(5) for b in range(4)]
+    assert len(calls) == 4
+    assert list(HyperGrid(a=range(2)) * (HyperGrid(b=range(2)) + HyperGrid(b=[5]))) == [(0, 0), (0, 1), (0, 5), (1, 0), (1, 1), (1, 5)]
@@ -0,0 +1,35 @@
+import subprocess
+import sys
+
+import pytest
+
+
+def loaded_modules(statement: str) -> set[str]:
+    code = f"import sys; {statement}; print(' '.join(sys.modules))"
+    return set(subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.split())
+
+
+def test_lazy_imports():
+    assert {module for module in loaded_modules("import hypergrid.dsl") if module.startswith("hypergrid")} == {"hypergrid", "hypergrid.dsl"}
+
+    modules = loaded_modules("from hypergrid.dsl import *; HyperGrid(x=linspace(0, 1, 5)).filter(lambda ge: ge.x > 0.5).sample()")
+    assert "hypergrid.grid" in modules
+    heavy = {"numpy", "scipy", "sklearn", "pyarrow", "sqlite3", "statistics", "hypergrid.ext.numpy", "hypergrid.cache", "hypergrid.search"}
+    assert not modules & heavy
+
+
+def test_lazy_attributes():
+    import hypergrid
+    import hypergrid.dsl
+
+    assert hypergrid.HyperGrid is hypergrid.dsl.HyperGrid
+    assert "linspace" in dir(hypergrid.dsl)
+    with pytest.raises(AttributeError):
+        hypergrid.dsl.missing  # noqa: B018
+    with pytest.raises(AttributeError):
+        hypergrid.missing  # noqa: B018
+
+    pytest.importorskip("numpy")
+    import hypergrid.ext
+
+    assert hypergrid.ext.numpy.ChunkedColumn is not None
@@ -0,0 +1,11 @@
+from hypothesis import given
+from hypothesis import strategies as st
+
+from hypergrid.permutation import IndexPermutation
+
+
+@given(st.integers(min_value=0, max_value=5000))
+def test_permutation_is_bijection(n):
+    permutation = IndexPermutation(n)
+    assert len(permutation) == n
+    assert sorted(permutation) == list(range(n))
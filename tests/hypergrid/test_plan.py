@@ -0,0 +1,27 @@
+from hypergrid.grid import HyperGrid, ProductGrid
+from hypergrid.plan import CompiledGrid
+
+
+def test_compiled_chain():
+    g = HyperGrid(example=range(10), example2=["a", "b", "c"]) * HyperGrid(example3=[0.5, 1.5])
+    g = g.map_to(example4=lambda ge: ge.example * ge.example3).filter(lambda ge: ge.example4 > 2).select("example2", "example4")
+    g = g.filter(lambda ge: ge.example2 != "b").map(example5=lambda ge: ge.example2 * 2, example6=lambda ge: ge.example4)
+    compiled = g.compile()
+    assert isinstance(compiled, CompiledGrid)
+    assert isinstance(compiled.source, ProductGrid)
+    assert len(compiled.stages) == 5
+    assert list(compiled) == list(g)
+    assert compiled[3] == g[3]
+    assert len(compiled) == len(g)
+
+
+def test_compiled_sources():
+    g = HyperGrid(example=[1, 2, 3])
+    assert list(g.compile()) == list(g)
+    assert list(g.filter(lambda ge: ge.example > 1).compile()) == [ge for ge in g if ge.example > 1]
+
+    # Sub-grids declaring the same fields in a different order
+    s = HyperGrid(example=[1, 2], example2=["a"]) + HyperGrid(example2=["b"], example=[3])
+    g = s.select("example2").map_to(example3=lambda ge: ge.example2 * 2)
+    assert list(g.compile()) == list(g)
+    assert [ge.example2 for ge in s.compile()] == ["a", "a", "b"]
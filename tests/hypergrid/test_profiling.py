@@ -0,0 +1,33 @@
+from hypergrid.dsl import profile
+from hypergrid.grid import FilterGrid, HyperGrid, MapToGrid
+
+
+def test_profile():
+    # Reads the mapped field, so it isn't pushed down below the map
+    def odd_sum(ge):
+        return (ge.x + ge.z) % 2 == 1
+
+    g = HyperGrid(x=range(20), y=range(10)).map_to(z=lambda ge: ge.x * ge.y).filter(odd_sum)
+    with profile() as p:
+        elements = [ge for ge in g]
+        g.compile().take(5)
+        g[3]
+
+    assert len(elements) == 50
+    stats = {stats.label: stats for stats in p.nodes.values()}
+    # Passes to iterate and to materialize for indexing, plus a fused one to count it and a compiled one stopping after 5 elements
+    assert stats["FilterGrid(odd_sum)"].produced == 50 + 50
+    assert stats["FilterGrid(odd_sum)"].predicate.calls == 200 + 200 + 200 + 19
+    assert stats["FilterGrid(odd_sum)"].rejected == 150 + 150 + 150 + 14
+    assert stats["FilterGrid(odd_sum)"].cache_bytes > 0
+    assert stats["MapToGrid(z)"].functions["z"].calls == 200 + 200 + 200 + 19
+    assert stats["HyperGrid(x, y)"].produced == 200 + 200
+    assert stats["HyperGrid(x, y)"].construction_seconds > 0
+    assert stats["HyperGrid(x, y)"].depth == 2
+    assert all(node.self_seconds <= node.seconds for node in p.nodes.values())
+    assert "FilterGrid(odd_sum)" in str(p)
+
+    # Everything is restored afterwards
+    assert "__iter__" in vars(HyperGrid) and HyperGrid.__iter__.__qualname__ == "HyperGrid.__iter__"
+    assert isinstance(g, FilterGrid) and g.predicate is odd_sum
+    assert isinstance(g.grid, MapToGrid) and not hasattr(g.grid.dimension_mapping["z"], "stats")
@@ -0,0 +1,28 @@
+import random
+
+from hypergrid.gen.distribution import Normal, Uniform
+from hypergrid.grid import HyperGrid
+from hypergrid.rng import generator, spawn, stream
+
+
+def _grid():
+    g = HyperGrid(example=range(100), example2=["a", "b", "c"]) + HyperGrid(example=range(5), example2=["d"])
+    return g.filter(lambda ge: ge.example % 2 == 0).map_to(example3=lambda ge: ge.example * 2)
+
+
+def test_seeded_sampling():
+    samples = [_grid().sample(random.Random(7)) for _ in range(20)]
+    assert samples == [_grid().sample(random.Random(7)) for _ in range(20)]
+    g1, g2 = _grid().with_seed(3), _grid().with_seed(3)
+    assert [g1.sample() for _ in range(50)] == [g2.sample() for _ in range(50)]
+    assert g1.sample_unique(10) == g2.sample_unique(10)
+    assert list(g1.shuffled()) == list(g2.shuffled())
+
+
+def test_streams():
+    streams = spawn(11, 4)
+    assert [s.random() for s in streams] == [stream(11, i).random() for i in range(4)]
+    assert len({s.random() for s in spawn(11, 4)}) == 4
+    assert [Uniform(0, 1).sample(stream(11, 0)) for _ in range(3)] != [Uniform(0, 1).sample(stream(11, 1)) for _ in range(3)]
+    assert Normal(0, 1).sample(stream(1, 0)) == Normal(0, 1).sample(stream(1, 0))
+    assert (Uniform(0, 1).sample_batch(5, generator(11, 2)) == Uniform(0, 1).sample_batch(5, generator(11, 2))).all()
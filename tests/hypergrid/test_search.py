@@ -0,0 +1,50 @@
+import multiprocessing
+import random
+from collections import Counter
+
+import pytest
+
+from hypergrid.grid import HyperGrid
+
+
+def loss(ge, budget):
+    # Noisy at small budgets, converging to the true loss as the budget grows
+    return (ge.x - 37) ** 2 + (ge.y - 2) ** 2 + 100 / budget * ((ge.x * 7 + ge.y) % 5)
+
+
+@pytest.mark.parametrize("executor", ["process", "thread"])
+def test_successive_halving(executor):
+    g = HyperGrid(x=range(100), y=range(5))
+    result = g.successive_halving(loss, budget=27, eta=3, n=81, executor=executor, workers=2, rng=random.Random(0))
+    assert Counter(trial.budget for trial in result.trials) == {1: 81, 3: 27, 9: 9, 27: 3}
+    assert all(isinstance(trial.budget, int) for trial in result.trials)
+    # Each rung re-evaluates the best of the previous one
+    rung1 = sorted((trial for trial in result.trials if trial.budget == 1), key=lambda trial: trial.score)
+    assert {trial.element for trial in result.trials if trial.budget == 3} == {trial.element for trial in rung1[:27]}
+    assert result.score == min(trial.score for trial in result.trials if trial.budget == 27)
+    assert result.score == loss(result.best, 27)
+
+    again = g.successive_halving(loss, budget=27, n=81, executor=executor, workers=2, rng=random.Random(0))
+    assert again.trials == result.trials
+
+
+def test_search_spawned_workers():
+    g = HyperGrid(x=range(100), y=range(5)).filter(lambda ge: ge.x % 2 == 0)
+    context = multiprocessing.get_context("spawn")
+    result = g.successive_halving(loss, budget=9, n=27, workers=2, rng=random.Random(0), mp_context=context)
+    assert result.trials == g.successive_halving(loss, budget=9, n=27, executor="thread", rng=random.Random(0)).trials
+
+
+def test_hyperband():
+    g = HyperGrid(x=range(100), y=range(5)).filter(lambda ge: ge.y != 2)
+    result = g.hyperband(lambda ge, budget: -loss(ge, budget), budget=9.0, maximize=True, executor="thread", workers=2, rng=random.Random(1))
+    # Brackets of 9, 5 and 3 candidates starting at budgets 1, 3 and 9
+    assert Counter(trial.budget for trial in result.trials) == {1.0: 9, 3.0: 3 + 5, 9.0: 1 + 1 + 3}
+    assert all(trial.element.y != 2 for trial in result.trials)
+    assert result.score == max(trial.score for trial in result.trials if trial.budget == 9.0)
+
+    small = HyperGrid(x=range(4))
+    result = small.successive_halving(lambda ge, budget: ge.x, budget=9, executor="thread")
+    assert result.best.x == 0 and len(result.trials) == 4 + 1 + 1
+    with pytest.raises(ValueError):
+        small.filter(lambda ge: False).successive_halving(lambda ge, budget: ge.x, budget=9, executor="thread")